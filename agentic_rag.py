@@ -0,0 +1,1692 @@
+import os
+import re
+import copy
+import json
+import hashlib
+import warnings
+import functools
+import threading
+from contextvars import ContextVar, copy_context
+from llama_index.core import Settings
+from llama_index.core.llms import ChatMessage, MessageRole
+from llama_index.core.tools import QueryEngineTool, FunctionTool
+from llama_index.core.tools.calling import call_tool_with_selection
+from llama_index.core.agent import FunctionCallingAgent
+from llama_index.llms.openai import OpenAI
+import yfinance as yf
+import pandas as pd
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Optional
+from datetime import datetime
+from itertools import islice
+from collections import defaultdict
+from operator import itemgetter
+from cachetools import TTLCache
+from cachetools.keys import hashkey
+from load_env import load_environment
+from financial_tools import (
+    extract_financial_insights,
+    get_company_financials,
+    sector_performance,
+    get_analyst_recommendations,
+    generate_investment_advice,
+    # Cryptocurrency functions
+    get_crypto_data,
+    get_crypto_market_data,
+    analyze_crypto,
+    generate_crypto_investment_advice,
+    compare_cryptos,
+    get_crypto_dominance
+)
+
+# Import TradingView API tools
+from tradingview_api import (
+    get_tradingview_crypto_analysis,
+    get_tradingview_crypto_market,
+    get_tradingview_multi_timeframe_analysis
+)
+
+# Import CoinMarketCap API tools
+from coinmarketcap_api import (
+    get_cmc_crypto_data,
+    get_cmc_crypto_market_overview,
+    get_cmc_crypto_analysis,
+    compare_cmc_cryptocurrencies,
+    get_cmc_investment_recommendation
+)
+
+# Load environment variables
+if not load_environment():
+    print("Failed to load required environment variables. Exiting.")
+    exit(1)
+
+# Configure LLM
+# Bound each completion call (one retry at most) so a single hung request fails instead of blocking
+# forever; a multi-step agent turn makes several calls and can still run past the backend's deadline
+LLM_REQUEST_TIMEOUT = 45
+Settings.llm = OpenAI(model="gpt-4o", temperature=0.1, timeout=LLM_REQUEST_TIMEOUT, max_retries=1)
+
+# Timestamp shared by every tool call made during one agent turn, as (analysis date, ISO timestamp)
+_TURN_CLOCK = ContextVar("_TURN_CLOCK", default=None)
+
+def _turn_clock():
+    """Return the current turn's (analysis date, ISO timestamp), or the wall clock outside an agent turn"""
+    clock = _TURN_CLOCK.get()
+    if clock is None:
+        now = datetime.now()
+        clock = (now.strftime("%Y-%m-%d"), now.isoformat())
+    return clock
+
+# Upper bound on concurrent data-source requests, shared by every tool call in the process
+MAX_FETCH_WORKERS = 16
+
+# Long-lived pool so tool calls don't pay thread start-up on every fan-out
+_FETCH_EXECUTOR = ThreadPoolExecutor(max_workers=MAX_FETCH_WORKERS, thread_name_prefix="fetch")
+_fetch_worker_state = threading.local()
+
+def _fetch_worker(fn, args):
+    """Run a fan-out call inside a pool thread, marking the thread so nested fan-outs run inline"""
+    _fetch_worker_state.active = True
+    try:
+        return fn(*args)
+    finally:
+        _fetch_worker_state.active = False
+
+def _run_concurrently(*calls):
+    """Run independent (function, *args) data-source calls in parallel and return their results in call order"""
+    # A worker waiting on more work queued to the same bounded pool could deadlock, so nest sequentially
+    if len(calls) <= 1 or getattr(_fetch_worker_state, "active", False):
+        return [fn(*args) for fn, *args in calls]
+    
+    # Each call runs in a copy of the caller's context so per-turn state (see _TURN_CLOCK) is visible
+    futures = [_FETCH_EXECUTOR.submit(copy_context().run, _fetch_worker, fn, args) for fn, *args in calls]
+    return [future.result() for future in futures]
+
+def _select_columns(closes, tickers):
+    """Return ``closes`` limited to ``tickers`` in that order, without copying when it already matches"""
+    tickers = list(tickers)
+    return closes if list(closes.columns) == tickers else closes.reindex(columns=tickers)
+
+def _close_points(closes, tickers):
+    """
+    Return the first, previous and latest valid close of each ticker as aligned NumPy arrays
+    
+    Tickers with fewer than two valid closes get NaN, so callers can detect them after the
+    vectorized percent-change math.
+    """
+    values = _select_columns(closes, tickers).to_numpy(dtype=float)
+    if values.shape[0] == 0:
+        empty = np.full(values.shape[1], np.nan)
+        return empty, empty, empty
+    
+    valid = ~np.isnan(values)
+    rank = valid.cumsum(axis=0)  # 1-based position of each close among the valid ones
+    count = rank[-1]
+    
+    def pick(position):
+        mask = valid & (rank == position) & (count >= 2)
+        return np.where(mask.any(axis=0), np.where(mask, values, 0.0).sum(axis=0), np.nan)
+    
+    return pick(1), pick(count - 1), pick(count)
+
+# Opt-in GPU correlation (FA_GPU=1, needs torch with CUDA) for baskets wide enough to outweigh the transfer
+USE_GPU = os.getenv("FA_GPU") == "1"
+GPU_MIN_TICKERS = 64
+
+def _gpu_corrcoef(values):
+    """Pearson correlation of the columns of ``values`` on a CUDA device, or None when no GPU path is available"""
+    try:
+        import torch
+    except ImportError:
+        return None
+    if not torch.cuda.is_available():
+        return None
+    
+    tensor = torch.as_tensor(values, dtype=torch.float32, device="cuda")
+    return torch.corrcoef(tensor.T).cpu().numpy().astype(np.float64)
+
+def _correlation_frame(closes):
+    """
+    Return the pairwise correlation of the close columns, rounded to 2 decimals, as a DataFrame
+    
+    Uses a single np.corrcoef call over the dates on which every ticker has a close; tickers
+    without any data come back as NaN rows and columns, as DataFrame.corr would report them.
+    """
+    populated = closes.dropna(axis=1, how="all")
+    clean = populated.dropna(how="any").to_numpy(dtype=np.float64)
+    width = clean.shape[1]
+    
+    if width and clean.shape[0] >= 2:
+        corr = _gpu_corrcoef(clean) if USE_GPU and width >= GPU_MIN_TICKERS else None
+        if corr is None:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                corr = np.atleast_2d(np.corrcoef(clean, rowvar=False))
+        corr = corr.round(2)
+    else:
+        corr = np.full((width, width), np.nan)
+    
+    return pd.DataFrame(corr, index=populated.columns, columns=populated.columns).reindex(index=closes.columns, columns=closes.columns)
+
+def _risk_metrics(prices):
+    """
+    Compute per-column risk metrics from a (dates x tickers) float64 close array
+    
+    Returns (daily volatility %, annualized volatility %, max drawdown %, Sharpe ratio) as
+    arrays with one entry per column. Missing closes are skipped like pandas' NaN-aware
+    reductions, and the Sharpe ratio is 0 where volatility is zero or undefined.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"), warnings.catch_warnings():
+        # All-NaN or single-close columns legitimately reduce to NaN
+        warnings.simplefilter("ignore", RuntimeWarning)
+        
+        returns = prices[1:] / prices[:-1] - 1.0
+        daily_std = np.nanstd(returns, axis=0, ddof=1)
+        mean_return = np.nanmean(returns, axis=0)
+        
+        # np.fmax ignores NaN, so the running peak carries over missing closes
+        drawdown = np.nanmin(prices / np.fmax.accumulate(prices, axis=0) - 1.0, axis=0)
+        sharpe = np.where(daily_std > 0, mean_return / daily_std * (252 ** 0.5), 0.0)
+    
+    return daily_std * 100, daily_std * (252 ** 0.5) * 100, drawdown * 100, sharpe
+
+def _percent_change(new, old):
+    """Element-wise percentage change between two aligned price arrays"""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return (new / old - 1.0) * 100
+
+@dataclass
+class SourceAnalysis:
+    """A data-source result normalized once so the combiners can branch on ``ok`` instead of re-validating"""
+    ok: bool
+    recommendation: str = "Neutral"
+    confidence: Optional[float] = None
+    signals: list = field(default_factory=list)
+    raw: Any = None
+
+def _is_ok(result):
+    """True when a data-source result is a usable payload rather than an error string or error dict"""
+    return isinstance(result, dict) and "error" not in result
+
+def _as_source(result, recommendation_key="recommendation", signals_key="technical_signals"):
+    """Normalize a wrapper's dict-or-error result into a SourceAnalysis"""
+    if not _is_ok(result):
+        return SourceAnalysis(ok=False, raw=result)
+    return SourceAnalysis(
+        ok=True,
+        recommendation=result.get(recommendation_key) or "Neutral",
+        confidence=result.get("confidence_score"),
+        signals=result.get(signals_key) or [],
+        raw=result
+    )
+
+# Directional score of each recommendation label used when building cross-source consensus
+RECOMMENDATION_SCORES = {
+    "Strong Buy": 2, "Buy": 1, "Mild Buy": 1,
+    "Hold": 0, "Neutral": 0,
+    "Mild Sell": -1, "Sell": -1, "Strong Sell": -2
+}
+
+def _vote_counts(recommendations):
+    """Return (buy votes, sell votes) for a list of recommendation labels"""
+    scores = [RECOMMENDATION_SCORES.get(r, 0) for r in recommendations]
+    return sum(score > 0 for score in scores), sum(score < 0 for score in scores)
+
+# Summary fields projected out of a successful generate_crypto_investment_advice result
+_YF_SUMMARY = itemgetter("recommendation", "potential_upside", "potential_downside", "technical_signals", "investment_thesis", "risks")
+
+# Stock comparison metrics served by yfinance's lightweight fast_info, and those that need the full .info payload
+FAST_INFO_METRICS = {
+    "market_cap": "market_cap",
+    "52w_high": "year_high",
+    "52w_low": "year_low",
+    "avg_volume": "three_month_average_volume"
+}
+INFO_ONLY_METRICS = {"pe_ratio", "eps", "dividend_yield", "sector", "industry"}
+
+# Symbol prefixes that mark a ticker list as cryptocurrencies when auto-detecting the asset type
+CRYPTO_PREFIXES = ("BTC", "ETH", "XRP", "LTC", "BCH", "ADA", "DOT", "LINK", "XLM", "DOGE", "UNI", "SOL")
+
+# Trailing "-USD" quote of a crypto symbol ("BTC-USD"). Only the dashed form counts: coins such as BUSD
+# and TUSD end in USD, and a bare "USD" must not become empty
+_USD_SUFFIX = re.compile(r"(?<=.)-USD$", re.IGNORECASE)
+
+@functools.lru_cache(maxsize=2048)
+def _norm_crypto(symbol):
+    """Return the (bare, Yahoo Finance) forms of a crypto symbol, e.g. "btc-usd" -> ("BTC", "BTC-USD")"""
+    base = _USD_SUFFIX.sub("", symbol.strip().upper())
+    # Pairs quoted in another currency (e.g. "ETH-EUR") are already valid Yahoo Finance symbols
+    return base, base if "-" in base else f"{base}-USD"
+
+def _iter_tradingview_signals(tv_analysis):
+    """Lazily flatten the per-timeframe signals of a TradingView multi-timeframe analysis"""
+    return (
+        {
+            "timeframe": tf,
+            "indicator": signal.get("indicator"),
+            "signal": signal.get("signal"),
+            "description": signal.get("description")
+        }
+        for tf, data in tv_analysis.get("timeframes", {}).items()
+        for signal in data.get("signals", ())
+    )
+
+def _tradingview_signals(tv_analysis):
+    """Flatten the per-timeframe signals of a TradingView multi-timeframe analysis into one list"""
+    return list(_iter_tradingview_signals(tv_analysis))
+
+def _notable_tradingview_signals(tv_analysis, limit):
+    """Return the first ``limit`` non-neutral TradingView signals, stopping as soon as enough are found"""
+    signals = _iter_tradingview_signals(tv_analysis)
+    return list(islice((s for s in signals if s["signal"] != "neutral"), limit))
+
+# Cache lifetimes (seconds) for market data versus slower-moving fundamentals
+MARKET_DATA_TTL = 60
+FUNDAMENTALS_TTL = 3600
+
+# Raw close histories are shared by several tools, so keep them a little longer than derived market data
+PRICE_HISTORY_TTL = 300
+
+def _is_error(value):
+    """Return True for the error shapes the data helpers return: an "Error..." string or a dict with an "error" key"""
+    return (isinstance(value, str) and value.startswith("Error")) or (isinstance(value, dict) and "error" in value)
+
+def _is_failed_result(result):
+    """Return True for a result that should be refetched rather than cached"""
+    # A price frame with no rows, or a ticker with no prices at all, means the download failed
+    if isinstance(result, pd.DataFrame):
+        return result.empty or bool(result.isna().all().any())
+    # Per-entry errors (one symbol or index that failed) would otherwise stick around for the whole TTL
+    if isinstance(result, dict):
+        return "error" in result or any(map(_is_error, result.values()))
+    return _is_error(result)
+
+def _ttl_cached(ttl, maxsize=512, copy_result=True):
+    """
+    Memoize a data-fetching wrapper for ``ttl`` seconds
+    
+    List arguments are keyed as tuples, failed or partly failed results are never cached, and callers
+    receive a copy so they can enrich the returned payload without touching the cache
+    (``copy_result=False`` shares the cached object with callers that only read it).
+    """
+    def freeze(value):
+        return tuple(value) if isinstance(value, list) else value
+    
+    def decorator(fn):
+        cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        lock = threading.Lock()
+        
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            key = hashkey(*map(freeze, args), **{k: freeze(v) for k, v in kwargs.items()})
+            with lock:
+                result = cache.get(key)
+            if result is None:
+                result = fn(*args, **kwargs)
+                if _is_failed_result(result):
+                    return result
+                with lock:
+                    cache[key] = result
+            return copy.deepcopy(result) if copy_result else result
+        
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    return decorator
+
+@_ttl_cached(PRICE_HISTORY_TTL, copy_result=False)
+def _download_closes(tickers, period):
+    """
+    Download closing prices for several tickers in one batched request (rows are dates, columns are tickers)
+    
+    Columns carry the caller's ticker spellings in the requested order, so "aapl" selects the same
+    data yfinance returns under "AAPL". The frame is shared through the cache, so callers must treat
+    it as read-only.
+    """
+    tickers = list(tickers)
+    # yfinance reports columns under the uppercased symbols it requested
+    symbols = [ticker.strip().upper() for ticker in tickers]
+    data = yf.download(list(dict.fromkeys(symbols)), period=period, auto_adjust=True, threads=True, progress=False)
+    closes = data["Close"]
+    if isinstance(closes, pd.Series):
+        closes = closes.to_frame(name=symbols[0])
+    closes = closes.reindex(columns=symbols)
+    closes.columns = tickers
+    return closes
+
+# Financial data tools
+@_ttl_cached(MARKET_DATA_TTL)
+def get_stock_data(ticker, period="1y", interval="1d"):
+    """Get historical stock price data for analysis"""
+    try:
+        closes = yf.Ticker(ticker).history(period=period, interval=interval)["Close"].to_numpy()
+        if closes.size == 0:
+            return f"Error retrieving data for {ticker}: no price data returned"
+        return f"Retrieved {closes.size} data points for {ticker}. Latest close price: {closes[-1]:.2f}"
+    except Exception as e:
+        return f"Error retrieving data for {ticker}: {str(e)}"
+
+def analyze_stock(ticker, period="6mo"):
+    """Comprehensive stock analysis with technical and fundamental indicators"""
+    try:
+        analysis = extract_financial_insights(ticker, period)
+        return analysis
+    except Exception as e:
+        return f"Error analyzing {ticker}: {str(e)}"
+
+def get_investment_recommendation(ticker, period="6mo", risk_tolerance="moderate"):
+    """Generate comprehensive investment recommendation and financial advice"""
+    try:
+        advice = generate_investment_advice(ticker, period, risk_tolerance)
+        return advice
+    except Exception as e:
+        return f"Error generating investment advice for {ticker}: {str(e)}"
+
+@_ttl_cached(MARKET_DATA_TTL)
+def get_market_indices():
+    """Get major market indices performance"""
+    indices = {
+        "S&P 500": "^GSPC",
+        "Dow Jones": "^DJI",
+        "NASDAQ": "^IXIC",
+        "Russell 2000": "^RUT"
+    }
+    
+    try:
+        # A single YTD window gives both the YTD start and the last two closes for the daily move
+        ytd_closes = _download_closes(list(indices.values()), "ytd")
+        ytd_start, previous, latest = _close_points(ytd_closes, indices.values())
+        if not np.isfinite(previous).all():
+            # In the first sessions of the year the YTD window is too short, so use a 5-day window for the daily move
+            _, previous, latest = _close_points(_download_closes(list(indices.values()), "5d"), indices.values())
+    except Exception as e:
+        return {name: f"Error: {str(e)}" for name in indices}
+    
+    daily_change = _percent_change(latest, previous)
+    ytd_change = _percent_change(latest, ytd_start)
+    
+    results = {}
+    for name, current, daily, ytd in zip(indices, latest.tolist(), daily_change.tolist(), ytd_change.tolist()):
+        if np.isfinite(daily):
+            results[name] = {
+                "current": current,
+                "daily_change_pct": daily,
+                "ytd_change_pct": ytd if np.isfinite(ytd) else None
+            }
+        else:
+            results[name] = f"Error: Insufficient price data for {indices[name]}"
+    
+    return results
+
+@_ttl_cached(MARKET_DATA_TTL)
+def compare_stocks(tickers, period="1y"):
+    """Compare performance of multiple stocks over a period"""
+    if not isinstance(tickers, list):
+        tickers = tickers.split(',')
+    
+    tickers = [t.strip() for t in tickers]
+    if not tickers:
+        return {}
+    
+    try:
+        # One batched request for all tickers
+        closes = _download_closes(tickers, period)
+    except Exception as e:
+        return {ticker: f"Error: {str(e)}" for ticker in tickers}
+    
+    start_prices, _, current_prices = _close_points(closes, tickers)
+    percent_changes = _percent_change(current_prices, start_prices)
+    
+    results = {}
+    for ticker, start_price, current_price, percent_change in zip(
+            tickers, start_prices.tolist(), current_prices.tolist(), percent_changes.tolist()):
+        if np.isfinite(percent_change):
+            results[ticker] = {
+                "start_price": start_price,
+                "current_price": current_price,
+                "percent_change": percent_change
+            }
+        else:
+            results[ticker] = f"Error: Insufficient price data for {ticker}"
+    
+    return results
+
+@_ttl_cached(MARKET_DATA_TTL)
+def get_economic_indicators():
+    """Get key economic indicators using Yahoo Finance data for related ETFs/indices"""
+    indicators = {
+        "10Y Treasury Yield": "^TNX",
+        "VIX Volatility Index": "^VIX",
+        "US Dollar Index": "DX-Y.NYB",
+        "Gold": "GC=F",
+        "Crude Oil": "CL=F"
+    }
+    
+    try:
+        # One batched request for all indicators
+        closes = _download_closes(list(indicators.values()), "5d")
+    except Exception as e:
+        return {name: f"Error: {str(e)}" for name in indicators}
+    
+    _, previous, latest = _close_points(closes, indicators.values())
+    daily_change = _percent_change(latest, previous)
+    
+    results = {}
+    for name, current, daily in zip(indicators, latest.tolist(), daily_change.tolist()):
+        if np.isfinite(daily):
+            results[name] = {
+                "current_value": current,
+                "daily_change_pct": daily
+            }
+        else:
+            results[name] = f"Error: Insufficient price data for {indicators[name]}"
+    
+    return results
+
+@_ttl_cached(FUNDAMENTALS_TTL)
+def get_sector_analysis():
+    """Analyze performance across market sectors"""
+    try:
+        return sector_performance()
+    except Exception as e:
+        return f"Error analyzing sectors: {str(e)}"
+
+# Cryptocurrency wrapper functions
+@_ttl_cached(MARKET_DATA_TTL)
+def get_crypto_analysis(symbol, period="6mo"):
+    """Comprehensive cryptocurrency analysis with technical indicators"""
+    try:
+        # Ensure proper suffix for crypto symbols
+        _, symbol = _norm_crypto(symbol)
+        return analyze_crypto(symbol, period)
+    except Exception as e:
+        return f"Error analyzing cryptocurrency {symbol}: {str(e)}"
+
+@_ttl_cached(MARKET_DATA_TTL)
+def get_crypto_investment_advice(symbol, period="6mo", risk_tolerance="moderate"):
+    """Generate cryptocurrency investment recommendation and financial advice"""
+    try:
+        # Ensure proper suffix for crypto symbols
+        _, symbol = _norm_crypto(symbol)
+        return generate_crypto_investment_advice(symbol, period, risk_tolerance)
+    except Exception as e:
+        return f"Error generating crypto investment advice for {symbol}: {str(e)}"
+
+def get_crypto_market_overview():
+    """Get overview of the cryptocurrency market including major coins"""
+    try:
+        market_data = get_crypto_market_data()
+        dominance_data = get_crypto_dominance()
+        
+        # Combine the data
+        result = {
+            "market_data": market_data,
+            "dominance_data": dominance_data,
+            "analysis_date": _turn_clock()[0]
+        }
+        
+        return result
+    except Exception as e:
+        return f"Error retrieving crypto market overview: {str(e)}"
+
+def compare_cryptocurrencies(symbols, period="1y"):
+    """Compare performance of multiple cryptocurrencies over a period"""
+    try:
+        return compare_cryptos(symbols, period)
+    except Exception as e:
+        return f"Error comparing cryptocurrencies: {str(e)}"
+
+# TradingView API wrapper functions
+@_ttl_cached(MARKET_DATA_TTL)
+def get_tradingview_crypto_technical_analysis(symbol, interval="1d"):
+    """Get detailed technical analysis from TradingView for a cryptocurrency"""
+    try:
+        return get_tradingview_crypto_analysis(symbol, interval)
+    except Exception as e:
+        return f"Error retrieving TradingView analysis for {symbol}: {str(e)}"
+
+@_ttl_cached(MARKET_DATA_TTL)
+def get_tradingview_crypto_market_overview():
+    """Get cryptocurrency market overview using TradingView data"""
+    try:
+        return get_tradingview_crypto_market()
+    except Exception as e:
+        return f"Error retrieving TradingView market overview: {str(e)}"
+
+@_ttl_cached(MARKET_DATA_TTL)
+def get_tradingview_multi_timeframe_crypto_analysis(symbol):
+    """Get multi-timeframe technical analysis for a cryptocurrency using TradingView"""
+    try:
+        return get_tradingview_multi_timeframe_analysis(symbol)
+    except Exception as e:
+        return f"Error retrieving multi-timeframe analysis for {symbol}: {str(e)}"
+
+# CoinMarketCap API wrapper functions
+@_ttl_cached(MARKET_DATA_TTL)
+def get_coinmarketcap_crypto_data(symbol):
+    """Get comprehensive data for a cryptocurrency from CoinMarketCap"""
+    try:
+        return get_cmc_crypto_data(symbol)
+    except Exception as e:
+        return f"Error retrieving CoinMarketCap data for {symbol}: {str(e)}"
+
+@_ttl_cached(MARKET_DATA_TTL)
+def get_coinmarketcap_crypto_market_overview():
+    """Get cryptocurrency market overview using CoinMarketCap data"""
+    try:
+        return get_cmc_crypto_market_overview()
+    except Exception as e:
+        return f"Error retrieving CoinMarketCap market overview: {str(e)}"
+
+@_ttl_cached(MARKET_DATA_TTL)
+def get_coinmarketcap_crypto_analysis(symbol):
+    """Analyze a cryptocurrency with data from CoinMarketCap"""
+    try:
+        return get_cmc_crypto_analysis(symbol)
+    except Exception as e:
+        return f"Error analyzing cryptocurrency with CoinMarketCap: {str(e)}"
+
+def compare_coinmarketcap_cryptocurrencies(symbols):
+    """Compare multiple cryptocurrencies using CoinMarketCap data"""
+    if not isinstance(symbols, list):
+        symbols = symbols.split(',')
+    
+    symbols = [s.strip() for s in symbols]
+    
+    try:
+        return compare_cmc_cryptocurrencies(symbols)
+    except Exception as e:
+        return f"Error comparing cryptocurrencies with CoinMarketCap: {str(e)}"
+
+@_ttl_cached(MARKET_DATA_TTL)
+def get_coinmarketcap_investment_recommendation(symbol, risk_tolerance="moderate"):
+    """Generate detailed investment recommendation for a cryptocurrency based on CoinMarketCap data"""
+    try:
+        return get_cmc_investment_recommendation(symbol, risk_tolerance)
+    except Exception as e:
+        return f"Error generating investment recommendation for {symbol}: {str(e)}"
+
+def get_buy_sell_recommendation(symbol, risk_tolerance="moderate", speculative=True):
+    """
+    Generate a comprehensive buy/sell recommendation for a cryptocurrency by combining the best data from all sources
+    
+    Parameters:
+    - symbol: Cryptocurrency symbol (e.g., "BTC", "ETH")
+    - risk_tolerance: User's risk tolerance level (low, moderate, high)
+    - speculative: Fetch the TradingView and Yahoo Finance fallbacks alongside CoinMarketCap instead of
+      waiting for it to fail first (set to False to avoid the extra requests)
+    
+    Returns:
+    - Dictionary containing detailed buy/sell recommendation with supporting data
+    """
+    try:
+        # Clean up symbol format
+        clean_symbol, _ = _norm_crypto(symbol)
+        # Yahoo Finance analysis period based on risk tolerance
+        period = "3mo" if risk_tolerance == "low" else "6mo" if risk_tolerance == "moderate" else "1y"
+        
+        # Get recommendations from all sources, prioritizing CoinMarketCap
+        if speculative:
+            cmc_analysis, tv_analysis, yf_analysis = _run_concurrently(
+                (get_coinmarketcap_investment_recommendation, clean_symbol, risk_tolerance),
+                (get_tradingview_multi_timeframe_crypto_analysis, clean_symbol),
+                (get_crypto_investment_advice, clean_symbol, period, risk_tolerance)
+            )
+        else:
+            cmc_analysis = get_coinmarketcap_investment_recommendation(clean_symbol, risk_tolerance)
+            tv_analysis = yf_analysis = None
+        cmc = _as_source(cmc_analysis)
+        
+        # If CoinMarketCap recommendation is successful, use it as our base
+        if cmc.ok:
+            cmc_recommendation = cmc.raw
+            # Try to supplement with data from other sources
+            try:
+                if not speculative:
+                    # Get TradingView and Yahoo Finance analysis concurrently
+                    tv_analysis, yf_analysis = _run_concurrently(
+                        (get_tradingview_multi_timeframe_crypto_analysis, clean_symbol),
+                        (get_crypto_investment_advice, clean_symbol, period, risk_tolerance)
+                    )
+                tv = _as_source(tv_analysis, recommendation_key="overall_sentiment")
+                yf_source = _as_source(yf_analysis)
+                
+                # Enhance the recommendation with additional insights if available
+                if tv.ok:
+                    cmc_recommendation["tradingview_analysis"] = {
+                        "recommendation": tv.recommendation,
+                        "timeframes": {k: v.get("overall_sentiment", "Unknown") for k, v in tv.raw.get("timeframes", {}).items() if "error" not in v}
+                    }
+                
+                if yf_source.ok:
+                    cmc_recommendation["yahoo_finance_analysis"] = {
+                        "recommendation": yf_source.recommendation,
+                        "confidence_score": yf_source.confidence,
+                        "technical_signals": yf_source.signals[:3]  # Top 3 signals
+                    }
+                
+                # Add a consensus field if we have multiple sources
+                recommendations = [source.recommendation for source in (cmc, tv, yf_source) if source.ok]
+                sources_available = len(recommendations)
+                
+                if sources_available > 1:
+                    # Determine if recommendations align
+                    buy_count, sell_count = _vote_counts(recommendations)
+                    
+                    # Only override with consensus if there's strong agreement
+                    if buy_count >= 2 and buy_count > sell_count:
+                        consensus = "Strong consensus to Buy" if buy_count == sources_available else "Moderate consensus to Buy"
+                    elif sell_count >= 2 and sell_count > buy_count:
+                        consensus = "Strong consensus to Sell" if sell_count == sources_available else "Moderate consensus to Sell"
+                    else:
+                        consensus = "Mixed signals across sources"
+                    
+                    cmc_recommendation["consensus"] = {
+                        "recommendation": consensus,
+                        "sources": sources_available,
+                        "agreement_level": "High" if buy_count == sources_available or sell_count == sources_available else "Moderate" if buy_count > sell_count or sell_count > buy_count else "Low"
+                    }
+            
+            except Exception as e:
+                # If enhancement fails, still return the CoinMarketCap recommendation
+                pass
+            
+            return cmc_recommendation
+        
+        # If CoinMarketCap fails, try TradingView next
+        if tv_analysis is None:
+            tv_analysis = get_tradingview_multi_timeframe_crypto_analysis(clean_symbol)
+        tv = _as_source(tv_analysis, recommendation_key="overall_sentiment")
+        if tv.ok:
+            # Format in a similar structure to CoinMarketCap recommendation
+            result = {
+                "symbol": clean_symbol,
+                "recommendation": tv.recommendation,
+                "confidence_score": 65,  # Lower confidence since it's not as detailed
+                "risk_tolerance": risk_tolerance,
+                "technical_signals": _tradingview_signals(tv.raw),
+                "investment_thesis": f"Based on TradingView technical analysis across multiple timeframes, the overall sentiment for {clean_symbol} is {tv.recommendation}.",
+                "risks": "TradingView analysis is primarily based on technical indicators and may not reflect fundamental factors or market news.",
+                "timestamp": _turn_clock()[1],
+                "disclaimer": "This analysis is for informational purposes only and should not be considered financial advice. Always conduct your own research and consider consulting with a financial advisor before making investment decisions. Cryptocurrency investments are especially high-risk and speculative."
+            }
+            
+            return result
+            
+        # If both fail, try Yahoo Finance
+        if yf_analysis is None:
+            yf_analysis = get_crypto_investment_advice(clean_symbol, period, risk_tolerance)
+        yf_source = _as_source(yf_analysis)
+        
+        if yf_source.ok:
+            return yf_source.raw
+        
+        # If all sources fail
+        return {"error": f"Unable to generate buy/sell recommendation for {symbol} from any source"}
+        
+    except Exception as e:
+        return {"error": f"Error generating buy/sell recommendation for {symbol}: {str(e)}"}
+
+def combine_all_crypto_analysis_sources(symbol, period="6mo", risk_tolerance="moderate"):
+    """Combine analysis from Yahoo Finance, TradingView, and CoinMarketCap for comprehensive cryptocurrency insights"""
+    try:
+        # Get analysis from all three sources concurrently
+        yf_analysis, tv_analysis, cmc_analysis = _run_concurrently(
+            (get_crypto_investment_advice, symbol, period, risk_tolerance),
+            (get_tradingview_multi_timeframe_crypto_analysis, symbol),
+            (get_coinmarketcap_crypto_analysis, symbol)
+        )
+        yf_source = _as_source(yf_analysis)
+        tv = _as_source(tv_analysis, recommendation_key="overall_sentiment")
+        cmc = _as_source(cmc_analysis, recommendation_key="overall_sentiment", signals_key="momentum_signals")
+        
+        # Extract key insights from all sources
+        if yf_source.ok and tv.ok and cmc.ok:
+            # Create combined recommendation
+            yf_recommendation = yf_source.recommendation
+            tv_recommendation = tv.recommendation
+            cmc_recommendation = cmc.recommendation
+            
+            # Determine consensus recommendation
+            recommendations = [yf_recommendation, tv_recommendation, cmc_recommendation]
+            buy_count, sell_count = _vote_counts(recommendations)
+            
+            if buy_count >= 2:
+                consensus = "Buy"
+            elif sell_count >= 2:
+                consensus = "Sell"
+            else:
+                consensus = "Neutral/Hold"
+            
+            # Extract price data
+            yf_price = yf_analysis.get("current_price", {}).get("price", 0)
+            tv_price = tv_analysis.get("timeframes", {}).get("1d", {}).get("close", 0)
+            cmc_price = cmc_analysis.get("price_usd", 0)
+            
+            # Use CoinMarketCap price if available (usually most accurate)
+            price = cmc_price or tv_price or yf_price
+            
+            # Extract market data from CoinMarketCap
+            market_cap = cmc_analysis.get("market_cap_usd", 0)
+            volume_24h = cmc_analysis.get("volume_24h_usd", 0)
+            volume_to_mcap_ratio = cmc_analysis.get("volume_to_mcap_ratio", 0)
+            
+            yf_rec, yf_upside, yf_downside, yf_signals, yf_thesis, yf_risks = _YF_SUMMARY(yf_analysis)
+            
+            # Combine the analysis
+            combined_analysis = {
+                "symbol": symbol,
+                "analysis_date": _turn_clock()[0],
+                "price_usd": price,
+                "market_cap_usd": market_cap,
+                "volume_24h_usd": volume_24h,
+                "volume_to_mcap_ratio": volume_to_mcap_ratio,
+                "source_recommendations": {
+                    "yahoo_finance": yf_recommendation,
+                    "tradingview": tv_recommendation,
+                    "coinmarketcap": cmc_recommendation
+                },
+                "consensus_recommendation": consensus,
+                "confidence_level": "High" if len(set(recommendations)) == 1 else "Moderate" if len(set(recommendations)) == 2 else "Low",
+                "yahoo_finance_analysis": {
+                    "recommendation": yf_rec,
+                    "confidence_score": yf_source.confidence,
+                    "potential_upside": yf_upside,
+                    "potential_downside": yf_downside,
+                    "signals": yf_signals
+                },
+                "tradingview_analysis": {
+                    "recommendation": tv_analysis.get("overall_sentiment"),
+                    "signal_counts": tv_analysis.get("signal_counts"),
+                    "notable_signals": _notable_tradingview_signals(tv_analysis, 3)  # Top 3 non-neutral signals
+                },
+                "coinmarketcap_analysis": {
+                    "recommendation": cmc_analysis.get("overall_sentiment"),
+                    "price_change_24h": cmc_analysis.get("percent_changes", {}).get("24h", 0),
+                    "price_change_7d": cmc_analysis.get("percent_changes", {}).get("7d", 0),
+                    "momentum_signals": cmc.signals[:3]  # Top 3 momentum signals
+                },
+                "investment_thesis": yf_thesis,
+                "risks": yf_risks
+            }
+            
+            return combined_analysis
+        else:
+            # Fall back to the most detailed source that is available
+            for source in (cmc, tv, yf_source):
+                if source.ok:
+                    return source.raw
+            return f"Error: No valid analysis available for {symbol} from any source"
+    except Exception as e:
+        return f"Error combining analysis for {symbol}: {str(e)}"
+
+def combine_crypto_analysis_sources(symbol, period="6mo", risk_tolerance="moderate"):
+    """Combine analysis from both Yahoo Finance and TradingView for comprehensive cryptocurrency insights"""
+    try:
+        # Get analysis from both sources concurrently
+        yf_analysis, tv_analysis = _run_concurrently(
+            (get_crypto_investment_advice, symbol, period, risk_tolerance),
+            (get_tradingview_multi_timeframe_crypto_analysis, symbol)
+        )
+        yf_source = _as_source(yf_analysis)
+        tv = _as_source(tv_analysis, recommendation_key="overall_sentiment")
+        
+        # Extract key insights from both sources
+        if yf_source.ok and tv.ok:
+            # Create combined recommendation
+            yf_recommendation = yf_source.recommendation
+            tv_recommendation = tv.recommendation
+            
+            # Determine if recommendations align
+            recommendations_align = (
+                (yf_recommendation in ["Strong Buy", "Buy"] and tv_recommendation in ["Strong Buy", "Buy"]) or
+                (yf_recommendation in ["Strong Sell", "Sell"] and tv_recommendation in ["Strong Sell", "Sell"]) or
+                (yf_recommendation in ["Hold", "Mild Buy"] and tv_recommendation in ["Neutral"])
+            )
+            
+            yf_rec, yf_upside, yf_downside, yf_signals, yf_thesis, yf_risks = _YF_SUMMARY(yf_analysis)
+            
+            # Combine the analysis
+            combined_analysis = {
+                "symbol": symbol,
+                "analysis_date": _turn_clock()[0],
+                "yahoo_finance": {
+                    "recommendation": yf_rec,
+                    "confidence_score": yf_source.confidence,
+                    "potential_upside": yf_upside,
+                    "potential_downside": yf_downside,
+                    "price_data": yf_analysis.get("current_price"),
+                    "signals": yf_signals
+                },
+                "tradingview": {
+                    "recommendation": tv_analysis.get("overall_sentiment"),
+                    "signal_counts": tv_analysis.get("signal_counts"),
+                    "notable_signals": _notable_tradingview_signals(tv_analysis, 5)  # Top 5 non-neutral signals
+                },
+                "combined_analysis": {
+                    "recommendations_align": recommendations_align,
+                    "combined_recommendation": tv_recommendation if recommendations_align else "Mixed Signals",
+                    "confidence_level": "High" if recommendations_align else "Moderate",
+                    "investment_thesis": yf_thesis,
+                    "risks": yf_risks
+                }
+            }
+            
+            return combined_analysis
+        else:
+            # Fall back to just one analysis if the other fails
+            for source in (yf_source, tv):
+                if source.ok:
+                    return source.raw
+            return f"Error combining analysis sources for {symbol}"
+    except Exception as e:
+        return f"Error combining analysis for {symbol}: {str(e)}"
+
+def _cmc_comparison(tickers):
+    """Return (CoinMarketCap comparison, ok) for the crypto comparison cascade"""
+    try:
+        cmc_data = compare_cmc_cryptocurrencies(tickers)
+    except Exception as e:
+        return {"error": f"CoinMarketCap comparison failed: {str(e)}"}, False
+    return cmc_data, _is_ok(cmc_data)
+
+def _tradingview_comparison(bare_tickers):
+    """Return (TradingView analyses keyed by symbol, ok) for the crypto comparison cascade"""
+    def fetch(clean_ticker):
+        try:
+            return get_tradingview_crypto_analysis(clean_ticker)
+        except Exception as e:
+            return {"error": str(e)}
+    
+    # TradingView has no multi-symbol endpoint here, so overlap the per-symbol requests
+    analyses = _run_concurrently(*[(fetch, clean_ticker) for clean_ticker in bare_tickers])
+    tv_data = {
+        clean_ticker: tv_analysis
+        for clean_ticker, tv_analysis in zip(bare_tickers, analyses)
+        if _is_ok(tv_analysis)
+    }
+    return {"tradingview_data": tv_data}, bool(tv_data)
+
+def comprehensive_ticker_comparison(tickers, asset_type="auto", period="1y", metrics=None):
+    """
+    Comprehensive comparison of multiple tickers (stocks or cryptocurrencies) with detailed metrics
+    
+    Parameters:
+    - tickers: List or comma-separated string of ticker symbols to compare
+    - asset_type: "stocks", "crypto", or "auto" to auto-detect based on symbols
+    - period: Time period for comparison (e.g., "1m", "3m", "6m", "1y", "2y", "5y")
+    - metrics: List of specific metrics to include (None for all available metrics)
+    
+    Returns:
+    - Dictionary containing comparative analysis and visualizable data
+    """
+    if isinstance(tickers, str):
+        tickers = [t.strip() for t in tickers.split(',')]
+    if isinstance(metrics, str):
+        metrics = [m.strip() for m in metrics.split(',') if m.strip()]
+    
+    if not tickers:
+        return {"error": "No tickers provided for comparison"}
+    
+    # Auto-detect asset type if not specified (any ticker matching a common crypto symbol or quoted in USD)
+    if asset_type == "auto":
+        is_crypto = any((t := ticker.upper()).startswith(CRYPTO_PREFIXES) or "-USD" in t for ticker in tickers)
+        asset_type = "crypto" if is_crypto else "stocks"
+    
+    # Use appropriate comparison function based on asset type
+    try:
+        results = {}
+        correlation_matrix = {}
+        corr_matrix = None
+        key_metrics = {}
+        
+        if asset_type == "stocks":
+            # Stock symbols are case-insensitive; use Yahoo's uppercase form so the batched closes,
+            # fundamentals and result keys all line up
+            tickers = [ticker.strip().upper() for ticker in tickers]
+            
+            # Get basic comparison data
+            comparison_data = compare_stocks(tickers, period)
+            
+            # Add additional metrics for stocks
+            # Only pay for the heavy .info fetch when a requested metric needs it
+            requested = set(metrics) if metrics else None
+            use_fast_info = requested is not None and requested.isdisjoint(INFO_ONLY_METRICS)
+            
+            def fetch_metrics(ticker):
+                try:
+                    # Get company fundamentals
+                    stock_info = yf.Ticker(ticker)
+                    if use_fast_info:
+                        fast_info = stock_info.fast_info
+                        ticker_metrics = {name: fast_info[key] for name, key in FAST_INFO_METRICS.items() if name in requested}
+                    else:
+                        info = stock_info.info
+                        ticker_metrics = {
+                            "market_cap": info.get("marketCap"),
+                            "pe_ratio": info.get("trailingPE"),
+                            "eps": info.get("trailingEps"),
+                            "dividend_yield": info.get("dividendYield", 0) * 100 if info.get("dividendYield") else 0,
+                            "52w_high": info.get("fiftyTwoWeekHigh"),
+                            "52w_low": info.get("fiftyTwoWeekLow"),
+                            "avg_volume": info.get("averageVolume"),
+                            "sector": info.get("sector"),
+                            "industry": info.get("industry")
+                        }
+                        if requested is not None:
+                            ticker_metrics = {name: value for name, value in ticker_metrics.items() if name in requested}
+                    
+                    # Get analyst recommendations
+                    if requested is None or "analyst_recommendation" in requested:
+                        try:
+                            recommendations = stock_info.recommendations
+                            if not recommendations.empty:
+                                recent_rec = recommendations.iloc[-1]
+                                ticker_metrics["analyst_recommendation"] = recent_rec["To Grade"] if "To Grade" in recent_rec else "N/A"
+                        except:
+                            ticker_metrics["analyst_recommendation"] = "N/A"
+                    
+                    return ticker_metrics
+                except Exception as e:
+                    return {"error": f"Could not retrieve detailed metrics: {str(e)}"}
+            
+            # Fundamentals are fetched per ticker, so overlap the requests
+            key_metrics = dict(zip(tickers, _run_concurrently(*[(fetch_metrics, ticker) for ticker in tickers])))
+            
+            # Calculate correlation matrix from one batched download of all closes
+            try:
+                df = _select_columns(_download_closes(tickers, period), tickers)
+                if not df.empty:
+                    corr_matrix = _correlation_frame(df)
+                    
+                    # Convert correlation matrix to dictionary for JSON serialization
+                    correlation_matrix = corr_matrix.to_dict()
+            except Exception as e:
+                corr_matrix = None
+                correlation_matrix = {"error": f"Error calculating correlation: {str(e)}"}
+                
+            # Add sector/industry analysis
+            sectors = defaultdict(list)
+            for ticker, ticker_metrics in key_metrics.items():
+                sectors[ticker_metrics.get("sector", "Unknown")].append(ticker)
+            sectors = dict(sectors)
+            
+            # Compile final results
+            results = {
+                "comparison_type": "stocks",
+                "period": period,
+                "tickers": tickers,
+                "basic_comparison": comparison_data,
+                "key_metrics": key_metrics,
+                "correlation_matrix": correlation_matrix,
+                "sector_grouping": sectors,
+                "analysis_date": _turn_clock()[0]
+            }
+            
+        else:  # Crypto comparison
+            # Normalize every symbol once: bare for TradingView, USD-quoted for Yahoo Finance; tickers stays for display
+            normalized = [_norm_crypto(ticker) for ticker in tickers]
+            bare_tickers = [bare for bare, _ in normalized]
+            yf_tickers = [yf_symbol for _, yf_symbol in normalized]
+            include_btc = not any(ticker.startswith("BTC") for ticker in bare_tickers)
+            
+            # Try to get best data from multiple sources: CoinMarketCap (most comprehensive crypto data),
+            # then TradingView, and Yahoo Finance if neither has data
+            cascade = (
+                ("CoinMarketCap", _cmc_comparison, tickers),
+                ("TradingView", _tradingview_comparison, bare_tickers)
+            )
+            for data_source, fetch, symbols in cascade:
+                comparison_data, ok = fetch(symbols)
+                if ok:
+                    break
+            else:
+                comparison_data = compare_cryptocurrencies(tickers, period)
+                data_source = "Yahoo Finance"
+            
+            # Download every close needed below (including BTC for the Bitcoin correlation) in one batched request
+            try:
+                closes = _download_closes(yf_tickers + ["BTC-USD"] if include_btc else yf_tickers, period)
+                download_error = None
+            except Exception as e:
+                closes, download_error = None, e
+            
+            # Add correlation data for cryptocurrencies (one joint matrix that also carries the BTC column)
+            btc_column = None
+            try:
+                if download_error is not None:
+                    raise download_error
+                df = _select_columns(closes, yf_tickers + ["BTC-USD"] if include_btc else yf_tickers)
+                if not df.empty:
+                    joint_matrix = _correlation_frame(df)
+                    if include_btc:
+                        btc_column = joint_matrix["BTC-USD"]
+                    corr_matrix = joint_matrix.loc[yf_tickers, yf_tickers]
+                    correlation_matrix = corr_matrix.to_dict()
+            except Exception as e:
+                corr_matrix = None
+                correlation_matrix = {"error": f"Error calculating correlation: {str(e)}"}
+            
+            # Add volatility and risk metrics, computed for every ticker at once over the close frame
+            volatility_metrics = {}
+            try:
+                if download_error is not None:
+                    raise download_error
+                
+                available = [ticker for ticker in yf_tickers if ticker in closes.columns]
+                column = {ticker: i for i, ticker in enumerate(available)}
+                
+                # Daily and annualized volatility, maximum drawdown (all in percent) and Sharpe ratio per column
+                daily_volatility, annualized_volatility, max_drawdown, sharpe_ratio = _risk_metrics(
+                    closes[available].to_numpy(dtype=np.float64)
+                )
+                
+                for ticker in yf_tickers:
+                    if ticker in column:
+                        i = column[ticker]
+                        volatility_metrics[ticker] = {
+                            "daily_volatility": float(daily_volatility[i]),
+                            "annualized_volatility": float(annualized_volatility[i]),
+                            "max_drawdown": float(max_drawdown[i]),
+                            "sharpe_ratio": float(sharpe_ratio[i])
+                        }
+                    else:
+                        volatility_metrics[ticker] = {"error": f"Error calculating volatility metrics: no price data for {ticker}"}
+            except Exception as e:
+                volatility_metrics = {ticker: {"error": f"Error calculating volatility metrics: {str(e)}"} for ticker in yf_tickers}
+            
+            # Compile final results
+            results = {
+                "comparison_type": "cryptocurrencies",
+                "period": period,
+                "tickers": tickers,
+                "data_source": data_source,
+                "basic_comparison": comparison_data,
+                "correlation_matrix": correlation_matrix,
+                "volatility_metrics": volatility_metrics,
+                "analysis_date": _turn_clock()[0]
+            }
+            
+            # Add Bitcoin correlation if BTC is not already in the comparison
+            if include_btc:
+                try:
+                    if download_error is not None:
+                        raise download_error
+                    if btc_column is None:
+                        raise ValueError("No Bitcoin price data for the period")
+                    
+                    # Each ticker's correlation with Bitcoin is the BTC column of the joint matrix
+                    results["bitcoin_correlation"] = btc_column.reindex(yf_tickers).to_dict()
+                except Exception as e:
+                    results["bitcoin_correlation"] = {"error": f"Error calculating Bitcoin correlation: {str(e)}"}
+        
+        # Generate summary insights
+        summary = []
+        
+        # Identify best and worst performers
+        if asset_type == "stocks":
+            performers = [(ticker, float(metrics["percent_change"] or 0)) 
+                         for ticker, metrics in comparison_data.items() 
+                         if isinstance(metrics, dict) and "percent_change" in metrics]
+        else:
+            # Handle different data sources for crypto
+            if data_source == "CoinMarketCap":
+                performers = [(ticker, float(data.get("percent_change_7d") or 0)) 
+                             for ticker, data in comparison_data.get("comparison_data", {}).items()
+                             if "error" not in data]
+            elif data_source == "Yahoo Finance":
+                performers = [(ticker, float(metrics["percent_change"] or 0)) 
+                             for ticker, metrics in comparison_data.items() 
+                             if isinstance(metrics, dict) and "percent_change" in metrics]
+            else:
+                performers = []
+        
+        if performers:
+            # Linear scans for the two extremes (ties resolve as the previous descending sort did)
+            best_performer = max(performers, key=itemgetter(1))
+            worst_performer = min(reversed(performers), key=itemgetter(1))
+            
+            summary.append(f"Best performer: {best_performer[0]} with {best_performer[1]:.2f}% return")
+            summary.append(f"Worst performer: {worst_performer[0]} with {worst_performer[1]:.2f}% return")
+        
+        # Add correlation insights
+        try:
+            if corr_matrix is not None and not corr_matrix.empty:
+                # Find highest and lowest correlated pairs, ignoring each ticker's correlation with itself
+                values = corr_matrix.to_numpy(dtype=float, copy=True)
+                np.fill_diagonal(values, np.nan)
+                
+                if not np.isnan(values).all():
+                    width = values.shape[1]
+                    high_i, high_j = divmod(int(np.nanargmax(values)), width)
+                    low_i, low_j = divmod(int(np.nanargmin(values)), width)
+                    highest_value, lowest_value = float(values[high_i, high_j]), float(values[low_i, low_j])
+                    
+                    if highest_value > -1:
+                        summary.append(f"Highest correlation: {corr_matrix.index[high_i]} and {corr_matrix.columns[high_j]} at {highest_value:.2f}")
+                    if lowest_value < 2:
+                        summary.append(f"Lowest correlation: {corr_matrix.index[low_i]} and {corr_matrix.columns[low_j]} at {lowest_value:.2f}")
+        except Exception as e:
+            summary.append(f"Could not calculate correlation insights: {str(e)}")
+        
+        # Add volatility comparison for crypto
+        if asset_type == "crypto" and volatility_metrics:
+            try:
+                # Find most and least volatile
+                volatility_list = [(ticker, float(data["annualized_volatility"])) 
+                                  for ticker, data in volatility_metrics.items() 
+                                  if isinstance(data, dict) and "annualized_volatility" in data]
+                
+                if volatility_list:
+                    most_volatile = max(volatility_list, key=itemgetter(1))
+                    least_volatile = min(reversed(volatility_list), key=itemgetter(1))
+                    
+                    summary.append(f"Most volatile: {most_volatile[0]} with {most_volatile[1]:.2f}% annualized volatility")
+                    summary.append(f"Least volatile: {least_volatile[0]} with {least_volatile[1]:.2f}% annualized volatility")
+            except Exception as e:
+                summary.append(f"Could not calculate volatility insights: {str(e)}")
+        
+        results["summary_insights"] = summary
+        return results
+        
+    except Exception as e:
+        return {"error": f"Error in comprehensive comparison: {str(e)}"}
+
+# Tool table: (function, tool name, description), in the order the agent lists them
+_TOOL_SPECS = [
+    # Stock market tools
+    (
+        get_investment_recommendation,
+        "get_investment_recommendation",
+        "Generate investment recommendations and financial advice for a stock based on technical and fundamental analysis. Returns buy/sell recommendation, confidence score, risk assessment, and investment thesis. Parameters: ticker (required), period (optional, default '6mo'), risk_tolerance (optional: 'low', 'moderate', 'high', default 'moderate')"
+    ),
+    (
+        get_stock_data,
+        "get_stock_data",
+        "Get historical stock price data for a given ticker symbol. Parameters: ticker (required), period (optional, default '1y'), interval (optional, default '1d')"
+    ),
+    (
+        analyze_stock,
+        "analyze_stock",
+        "Perform comprehensive technical and fundamental analysis on a stock. Returns price trends, technical indicators, company fundamentals, and analyst recommendations. Parameters: ticker (required), period (optional, default '6mo')"
+    ),
+    (
+        get_market_indices,
+        "get_market_indices",
+        "Get the current values and recent performance of major market indices (S&P 500, Dow Jones, NASDAQ, Russell 2000)"
+    ),
+    (
+        compare_stocks,
+        "compare_stocks",
+        "Compare the performance of multiple stocks over a given time period. Parameters: tickers (required, comma-separated string or list), period (optional, default '1y')"
+    ),
+    (
+        get_economic_indicators,
+        "get_economic_indicators",
+        "Get current values of key economic indicators including Treasury yields, VIX volatility index, US Dollar index, gold and oil prices"
+    ),
+    (
+        get_sector_analysis,
+        "get_sector_analysis",
+        "Get performance analysis of different market sectors (Technology, Healthcare, Financials, etc.) over various time periods"
+    ),
+    (
+        _ttl_cached(FUNDAMENTALS_TTL)(get_company_financials),
+        "get_company_financials",
+        "Get detailed financial data for a company including key financial metrics, ratios, and growth figures. Parameter: ticker (required)"
+    ),
+    (
+        _ttl_cached(FUNDAMENTALS_TTL)(get_analyst_recommendations),
+        "get_analyst_recommendations",
+        "Get recent analyst recommendations and ratings for a stock. Parameter: ticker (required)"
+    ),
+    
+    # Cryptocurrency tools - Yahoo Finance
+    (
+        get_crypto_investment_advice,
+        "get_crypto_investment_advice",
+        "Generate investment recommendations and financial advice for a cryptocurrency based on technical analysis. Returns buy/sell recommendation, confidence score, risk assessment, and investment thesis. Parameters: symbol (required), period (optional, default '6mo'), risk_tolerance (optional: 'low', 'moderate', 'high', default 'moderate')"
+    ),
+    (
+        get_crypto_analysis,
+        "get_crypto_analysis",
+        "Perform comprehensive technical analysis on a cryptocurrency. Returns price trends, technical indicators, and market metrics. Parameters: symbol (required, e.g., 'BTC', 'ETH', or with suffix like 'BTC-USD'), period (optional, default '6mo')"
+    ),
+    (
+        get_crypto_market_overview,
+        "get_crypto_market_overview",
+        "Get overview of the cryptocurrency market including performance data for major coins and Bitcoin dominance metrics"
+    ),
+    (
+        compare_cryptocurrencies,
+        "compare_cryptocurrencies",
+        "Compare the performance and technical indicators of multiple cryptocurrencies. Parameters: symbols (required, comma-separated string like 'BTC,ETH,ADA' or list), period (optional, default '1y')"
+    ),
+    
+    # Cryptocurrency tools - TradingView
+    (
+        get_tradingview_crypto_technical_analysis,
+        "get_tradingview_crypto_analysis",
+        "Get detailed technical analysis from TradingView for a cryptocurrency. Includes advanced indicators and signals. Parameters: symbol (required, e.g., 'BTC', 'ETH'), interval (optional, e.g., '1d', '4h', '1h', '15m', default '1d')"
+    ),
+    (
+        get_tradingview_crypto_market_overview,
+        "get_tradingview_market_overview",
+        "Get cryptocurrency market overview using TradingView data. Includes major coins with price, change, volume, and technical sentiment"
+    ),
+    (
+        get_tradingview_multi_timeframe_crypto_analysis,
+        "get_tradingview_multi_timeframe_analysis",
+        "Get multi-timeframe (1d, 4h, 1h, 15m) technical analysis for a cryptocurrency using TradingView. Parameter: symbol (required, e.g., 'BTC', 'ETH')"
+    ),
+    (
+        combine_crypto_analysis_sources,
+        "get_combined_crypto_analysis",
+        "Get comprehensive cryptocurrency analysis combining data from both Yahoo Finance and TradingView. Parameters: symbol (required), period (optional, default '6mo'), risk_tolerance (optional, default 'moderate')"
+    ),
+    
+    # Cryptocurrency tools - CoinMarketCap
+    (
+        get_coinmarketcap_crypto_data,
+        "get_coinmarketcap_crypto_data",
+        "Get comprehensive data for a cryptocurrency from CoinMarketCap. Parameter: symbol (required)"
+    ),
+    (
+        get_coinmarketcap_crypto_market_overview,
+        "get_coinmarketcap_crypto_market_overview",
+        "Get cryptocurrency market overview using CoinMarketCap data"
+    ),
+    (
+        get_coinmarketcap_crypto_analysis,
+        "get_coinmarketcap_crypto_analysis",
+        "Analyze a cryptocurrency with data from CoinMarketCap. Parameter: symbol (required)"
+    ),
+    (
+        compare_coinmarketcap_cryptocurrencies,
+        "compare_coinmarketcap_cryptocurrencies",
+        "Compare multiple cryptocurrencies using CoinMarketCap data. Parameters: symbols (required, comma-separated string like 'BTC,ETH,ADA' or list)"
+    ),
+    (
+        get_coinmarketcap_investment_recommendation,
+        "get_coinmarketcap_investment_recommendation",
+        "Generate detailed investment recommendation for a cryptocurrency based on CoinMarketCap data. Parameters: symbol (required), risk_tolerance (optional: 'low', 'moderate', 'high', default 'moderate')"
+    ),
+    (
+        combine_all_crypto_analysis_sources,
+        "get_all_sources_crypto_analysis",
+        "Get comprehensive cryptocurrency analysis combining data from Yahoo Finance, TradingView, and CoinMarketCap. Parameters: symbol (required), period (optional, default '6mo'), risk_tolerance (optional, default 'moderate')"
+    ),
+    
+    # Specialized crypto advice tools
+    (
+        get_buy_sell_recommendation,
+        "get_buy_sell_recommendation",
+        "Generate a comprehensive buy/sell recommendation for a cryptocurrency by combining the best data from all sources. Parameters: symbol (required), risk_tolerance (optional: 'low', 'moderate', 'high', default 'moderate')"
+    ),
+    (
+        comprehensive_ticker_comparison,
+        "comprehensive_ticker_comparison",
+        "Perform a comprehensive comparison of multiple tickers (stocks or cryptocurrencies) with detailed metrics and visualizable data. Parameters: tickers (required, comma-separated string or list), asset_type (optional: 'stocks', 'crypto', or 'auto' to auto-detect), period (optional, default '1y'), metrics (optional, specific metrics to include)"
+    )
+]
+
+@functools.lru_cache(maxsize=1)
+def build_tools():
+    """Build the agent's FunctionTool wrappers once per process (each one introspects its function's signature)"""
+    return tuple(
+        FunctionTool.from_defaults(fn=fn, name=name, description=description)
+        for fn, name, description in _TOOL_SPECS
+    )
+
+# Financial documents to index when present
+FINANCIAL_DOCS_PATH = "./financial_docs"  # Create this directory and add relevant financial PDFs
+FINANCIAL_REPORT_PDF = "./financial_reports.pdf"  # Update this path as needed
+
+# Documents are split and embedded this many at a time while they are being read
+DOCUMENT_INGEST_BATCH = 64
+
+# Embedded index persisted between runs, with a manifest recording which documents it was built from
+INDEX_CACHE_DIR = "./.index_cache"
+INDEX_MANIFEST = os.path.join(INDEX_CACHE_DIR, "manifest.json")
+
+def _document_fingerprint():
+    """Return a checksum of the indexed documents' names, sizes and modification times"""
+    entries = []
+    if os.path.isdir(FINANCIAL_DOCS_PATH):
+        for name in sorted(os.listdir(FINANCIAL_DOCS_PATH)):
+            stat = os.stat(os.path.join(FINANCIAL_DOCS_PATH, name))
+            entries.append([name, stat.st_size, stat.st_mtime_ns])
+    if os.path.exists(FINANCIAL_REPORT_PDF):
+        stat = os.stat(FINANCIAL_REPORT_PDF)
+        entries.append([FINANCIAL_REPORT_PDF, stat.st_size, stat.st_mtime_ns])
+    return hashlib.sha256(json.dumps(entries).encode()).hexdigest()
+
+def _load_cached_index(fingerprint):
+    """Load the persisted index if it was built from the same documents, otherwise return None"""
+    try:
+        with open(INDEX_MANIFEST) as f:
+            if json.load(f).get("fingerprint") != fingerprint:
+                return None
+    except (OSError, ValueError):
+        return None
+    
+    from llama_index.core import StorageContext, load_index_from_storage
+    
+    print(f"Loading cached vector index from {INDEX_CACHE_DIR}...")
+    return load_index_from_storage(StorageContext.from_defaults(persist_dir=INDEX_CACHE_DIR))
+
+def _persist_index(index, fingerprint):
+    """Save the index and its document manifest so the next run can skip re-embedding"""
+    index.storage_context.persist(persist_dir=INDEX_CACHE_DIR)
+    with open(INDEX_MANIFEST, "w") as f:
+        json.dump({"fingerprint": fingerprint}, f)
+
+def _iter_document_batches():
+    """Yield the financial documents in batches of about DOCUMENT_INGEST_BATCH, reading files one at a time"""
+    batch = []
+    
+    if os.path.exists(FINANCIAL_DOCS_PATH):
+        from llama_index.core import SimpleDirectoryReader
+        
+        print(f"Loading documents from {FINANCIAL_DOCS_PATH}...")
+        # Stream traditional documents file by file instead of loading the whole directory up front
+        for file_documents in SimpleDirectoryReader(FINANCIAL_DOCS_PATH).iter_data():
+            batch.extend(file_documents)
+            if len(batch) >= DOCUMENT_INGEST_BATCH:
+                yield batch
+                batch = []
+    
+    # Add option to parse PDF reports using LlamaParse
+    if os.path.exists(FINANCIAL_REPORT_PDF):
+        # LlamaParse is only needed (and only imported) when there is a report to parse
+        from llama_parse import LlamaParse
+        
+        print(f"Parsing PDF report: {FINANCIAL_REPORT_PDF}...")
+        batch.extend(LlamaParse(result_type="markdown").load_data(FINANCIAL_REPORT_PDF))
+    
+    if batch:
+        yield batch
+
+def _build_document_index():
+    """Chunk and embed the financial documents batch by batch into a vector index (None if there are no documents)"""
+    from llama_index.core import VectorStoreIndex
+    from llama_index.core.ingestion import IngestionPipeline
+    from llama_index.core.node_parser import SentenceSplitter
+    
+    # Nodes leave the pipeline already embedded, so the index stores them without embedding again
+    pipeline = IngestionPipeline(transformations=[SentenceSplitter(), Settings.embed_model])
+    index = None
+    
+    for batch in _iter_document_batches():
+        print(f"Indexing {len(batch)} documents...")
+        nodes = pipeline.run(documents=batch, show_progress=False)
+        if index is None:
+            index = VectorStoreIndex(nodes=nodes)
+        else:
+            index.insert_nodes(nodes)
+    
+    return index
+
+@functools.lru_cache(maxsize=1)
+def get_tools():
+    """Return the agent's tool list: the financial data tools, plus a document search tool when documents exist"""
+    base_tools = list(build_tools())
+    
+    if not (os.path.exists(FINANCIAL_DOCS_PATH) or os.path.exists(FINANCIAL_REPORT_PDF)):
+        print("No documents found. Using only financial data tools.")
+        return base_tools
+    
+    # Reuse the persisted vector index when the documents are unchanged, otherwise build and persist it
+    try:
+        fingerprint = _document_fingerprint()
+        index = _load_cached_index(fingerprint)
+        if index is None:
+            index = _build_document_index()
+            if index is not None:
+                _persist_index(index, fingerprint)
+    except Exception as e:
+        print(f"Error creating index: {str(e)}")
+        return base_tools
+    if index is None:
+        return base_tools
+    
+    # Create document query tool
+    document_tool = QueryEngineTool.from_defaults(
+        index.as_query_engine(),
+        name="financial_documents_tool",
+        description="Search through financial documents, reports, and filings for information",
+    )
+    
+    # Add document tool to tools list
+    return base_tools + [document_tool]
+
+# Create the financial analysis agent
+system_prompt = """You are an expert financial analysis agent specialized in market analysis and investment recommendations for both traditional stocks and cryptocurrencies.
+
+Your capabilities include:
+1. Providing investment recommendations with confidence scores and risk assessments for stocks and cryptocurrencies
+2. Analyzing stocks using technical indicators (moving averages, RSI, MACD, Bollinger Bands)
+3. Evaluating company fundamentals (P/E ratio, revenue growth, profit margins)
+4. Analyzing cryptocurrencies using technical indicators and market metrics from multiple sources (Yahoo Finance, TradingView, and CoinMarketCap)
+5. Tracking major market indices, economic indicators, and crypto market trends
+6. Comparing multiple stocks or cryptocurrencies with detailed metrics, correlations, and insights
+7. Retrieving information from financial documents and reports
+
+When providing stock analysis:
+- Focus on both technical and fundamental factors
+- Explain how earnings, growth, and financial health affect your recommendation
+- Compare against sector and market performance
+
+When providing cryptocurrency analysis:
+- Use data from all three sources (Yahoo Finance, TradingView, and CoinMarketCap) for the most comprehensive analysis
+- Analyze multiple timeframes (daily, 4-hour, 1-hour) for better insight
+- Consider market dominance, volatility, trading volume, and on-chain metrics
+- Explain how market trends and Bitcoin performance might affect altcoins
+- Use advanced technical indicators to identify market trends
+- Use CoinMarketCap for the most accurate market data, including price, market cap, and trading volume
+
+When users ask to compare multiple assets:
+- Always use the comprehensive_ticker_comparison tool for these requests
+- The tool auto-detects whether the tickers are stocks or cryptocurrencies
+- Provide insights on relative performance, correlation between assets, and volatility
+- For stocks, include fundamental metrics comparison and sector analysis
+- For cryptocurrencies, include Bitcoin correlation and risk metrics
+- Present the comprehensive data in a way that highlights key differences and similarities
+
+When users ask for investment advice or if they should buy/sell a cryptocurrency:
+- IMPORTANT: Always use the specialized buy_sell_recommendation_tool for these questions
+- Make sure to extract the cryptocurrency symbol from their question
+- Assess the user's risk tolerance from context or default to "moderate"
+- Provide a clear recommendation (Buy, Hold, or Sell) with a confidence score
+- Explain your reasoning by citing specific metrics and trends
+- Include the technical score and what it's based on
+- Detail both potential upside and downside scenarios with percentage estimates
+- Give a risk assessment appropriate to the user's risk tolerance
+- Present an investment thesis explaining why this recommendation makes sense
+- Highlight specific risks so the user can make an informed decision
+- Always include the market cap, trading volume, and recent price performance in your answer
+- Make sure to include the disclaimer about financial advice
+
+Your combined cryptocurrency analysis provides:
+- Multi-source verification (Yahoo Finance + TradingView + CoinMarketCap)
+- Multi-timeframe perspective (long and short-term trends)
+- Consensus recommendations with confidence level
+- Risk-adjusted potential returns
+- Detailed price momentum analysis across different timeframes
+
+For all investment recommendations:
+- Always explain the reasoning behind your conclusions
+- Highlight both potential upside and risks
+- Consider market conditions and trends
+- Provide balanced perspectives with supporting data
+- Tailor advice based on investor risk tolerance (low, moderate, high)
+- Be especially cautious with high-risk assets like cryptocurrencies
+
+Your goal is to provide data-driven financial insights that help with investment decisions.
+
+IMPORTANT DISCLAIMER: Add this to all investment recommendations: "This analysis is for informational purposes only and should not be considered financial advice. Always conduct your own research and consider consulting with a financial advisor before making investment decisions. Cryptocurrency investments are especially high-risk and speculative."
+"""
+
+@functools.lru_cache(maxsize=1)
+def get_agent():
+    """Build the financial analysis agent on first use, so importing this module stays cheap"""
+    # Native function calling lets the model request several independent tools (e.g. one per ticker) in a single step
+    return FunctionCallingAgent.from_tools(
+        get_tools(), 
+        llm=Settings.llm,
+        verbose=True,
+        system_prompt=system_prompt,
+        allow_parallel_tool_calls=True
+    )
+
+def __getattr__(name):
+    """Resolve the lazily built ``agent``, ``tools`` and ``base_tools`` module attributes (PEP 562)"""
+    if name == "agent":
+        return get_agent()
+    if name == "tools":
+        return get_tools()
+    if name == "base_tools":
+        return list(build_tools())
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def run_agent_turn(message):
+    """Send a message to the agent, stamping every tool call in this turn with the same timestamp"""
+    now = datetime.now()
+    token = _TURN_CLOCK.set((now.strftime("%Y-%m-%d"), now.isoformat()))
+    try:
+        return get_agent().chat(message)
+    finally:
+        _TURN_CLOCK.reset(token)
+
+# Tool-calling rounds a streamed turn may run before the model has to answer from what it gathered
+STREAM_MAX_TOOL_ROUNDS = 5
+
+def _stream_deltas(stream):
+    """Yield the text deltas of a streamed chat completion and return its final, accumulated response"""
+    response = None
+    for response in stream:
+        if response.delta:
+            yield response.delta
+    return response
+
+def stream_agent_turn(message):
+    """
+    Like run_agent_turn, but yield the answer text as the LLM decodes it
+    
+    FunctionCallingAgent cannot stream, so this drives the same LLM, tools and system prompt directly:
+    each round streams a tool-enabled completion, runs any tools it asks for and feeds their output back,
+    until a round answers without calling a tool. The turn is added to the agent's memory once complete.
+    """
+    now = datetime.now()
+    clock = (now.strftime("%Y-%m-%d"), now.isoformat())
+    llm = Settings.llm
+    tools = get_tools()
+    memory = get_agent().memory
+    history = [ChatMessage(role=MessageRole.SYSTEM, content=system_prompt), *memory.get(input=message)]
+    new_messages = [ChatMessage(role=MessageRole.USER, content=message)]
+    
+    for _ in range(STREAM_MAX_TOOL_ROUNDS):
+        response = yield from _stream_deltas(
+            llm.stream_chat_with_tools(tools, chat_history=history + new_messages, allow_parallel_tool_calls=True)
+        )
+        if response is None:
+            break
+        new_messages.append(response.message)
+        tool_calls = llm.get_tool_calls_from_response(response, error_on_no_tool_call=False)
+        if not tool_calls:
+            break
+        
+        # Every tool call in the turn shares one timestamp, as in run_agent_turn
+        for tool_call in tool_calls:
+            token = _TURN_CLOCK.set(clock)
+            try:
+                output = call_tool_with_selection(tool_call, tools)
+            finally:
+                _TURN_CLOCK.reset(token)
+            new_messages.append(ChatMessage(
+                role=MessageRole.TOOL,
+                content=str(output),
+                additional_kwargs={"name": tool_call.tool_name, "tool_call_id": tool_call.tool_id}
+            ))
+    else:
+        # Out of tool rounds: the model answers from the tool output it already has
+        response = yield from _stream_deltas(llm.stream_chat(history + new_messages))
+        if response is not None:
+            new_messages.append(response.message)
+    
+    for turn_message in new_messages:
+        memory.put(turn_message)
+
+# Example usage
+if __name__ == "__main__":
+    get_agent()
+    base_tools = build_tools()
+    
+    print("\n" + "="*50)
+    print("Financial Analysis Agent initialized")
+    print("="*50)
+    print("Available tools:")
+    
+    # Display stock tools
+    print("\nStock Market Analysis Tools:")
+    stock_tools = [t for t in base_tools[:9]]
+    for i, tool in enumerate(stock_tools, 1):
+        print(f"{i}. {tool.metadata.name}: {tool.metadata.description.split('.')[0]}")
+    
+    # Display Yahoo Finance crypto tools
+    print("\nCryptocurrency Analysis Tools (Yahoo Finance):")
+    yf_crypto_tools = [t for t in base_tools[9:13]]
+    for i, tool in enumerate(yf_crypto_tools, 1):
+        print(f"{i}. {tool.metadata.name}: {tool.metadata.description.split('.')[0]}")
+    
+    # Display TradingView crypto tools
+    print("\nCryptocurrency Analysis Tools (TradingView):")
+    tv_crypto_tools = [t for t in base_tools[13:17]]
+    for i, tool in enumerate(tv_crypto_tools, 1):
+        print(f"{i}. {tool.metadata.name}: {tool.metadata.description.split('.')[0]}")
+    
+    # Display CoinMarketCap crypto tools
+    print("\nCryptocurrency Analysis Tools (CoinMarketCap):")
+    cmc_crypto_tools = [t for t in base_tools[17:]]
+    for i, tool in enumerate(cmc_crypto_tools, 1):
+        print(f"{i}. {tool.metadata.name}: {tool.metadata.description.split('.')[0]}")
+    
+    print("\n" + "="*50)
+    print("Example queries:")
+    print("\nFor Stocks:")
+    print("- 'What's your investment recommendation for AAPL?'")
+    print("- 'Analyze TSLA stock with a high risk tolerance'")
+    print("- 'Compare the performance of MSFT, GOOGL, and AMZN'")
+    
+    print("\nFor Cryptocurrencies:")
+    print("- 'What's your combined analysis for Bitcoin using all data sources?'")
+    print("- 'Should I buy Ethereum right now?'")
+    print("- 'Is it a good time to sell Solana given my moderate risk tolerance?'")
+    print("- 'Give me a detailed investment recommendation for BNB'")
+    print("- 'Compare BTC, ETH, and SOL performance using all data sources'")
+    print("- 'What's the TradingView market sentiment for cryptocurrencies?'")
+    print("- 'Get detailed CoinMarketCap data for Cardano (ADA)'")
+    print("- 'What's the current crypto market overview from CoinMarketCap?'")
+    print("- 'Give me a comprehensive price momentum analysis for Solana from CoinMarketCap'")
+    
+    print("\nGeneral Queries:")
+    print("- 'What are the current market conditions?'")
+    print("- 'How are tech stocks and cryptocurrencies correlated?'")
+    
+    print("\n" + "="*50)
+    print("Type 'exit' to quit")
+    print("="*50 + "\n")
+    
+    while True:
+        user_input = input("\nEnter your financial query: ")
+        if user_input.lower() in ["exit", "quit", "q"]:
+            break
+            
+        print("\nProcessing your query...\n")
+        try:
+            response = run_agent_turn(user_input)
+            print(f"\nAgent response: {response}")
+        except Exception as e:
+            print(f"Error processing query: {str(e)}")
+            
+    print("\nThank you for using the Financial Analysis Agent!")
\ No newline at end of file
@@ -1,352 +1,492 @@
+import os
+
+# Cap native thread pools before NumPy/pandas/tokenizers load: requests already run in parallel across
+# server threads, and each library spawning one thread per core on top of that just oversubscribes the CPU
+for _thread_env in ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS", "NUMEXPR_NUM_THREADS"):
+    os.environ.setdefault(_thread_env, "1")
+os.environ.setdefault("TOKENIZERS_PARALLELISM", "false")
+
 import logging
-import signal
-import platform
+import logging.handlers
+import asyncio
+import atexit
+import queue
+import re
 import threading
-from flask import Flask, request, jsonify
+from concurrent.futures import ThreadPoolExecutor
+from cachetools import TTLCache
+from flask import Flask, request, stream_with_context
+from flask.json.provider import JSONProvider
+from werkzeug.exceptions import HTTPException
 from flask_cors import CORS
-import os
 import sys
-import json
-from werkzeug.exceptions import BadRequest
+import orjson
 
-# Configure logging
-logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
+# Configure logging: request threads only enqueue records, and a listener thread formats and writes them
+# to stderr, so slow console I/O stays off the request path. LOG_LEVEL=DEBUG turns on verbose output
+log_queue = queue.SimpleQueue()
+_log_output = logging.StreamHandler()
+_log_output.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+log_listener = logging.handlers.QueueListener(log_queue, _log_output)
+logging.basicConfig(level=os.environ.get('LOG_LEVEL', 'INFO').upper(), format='%(message)s', handlers=[logging.handlers.QueueHandler(log_queue)])
+log_listener.start()
+atexit.register(log_listener.stop)
 
 # Add the parent directory to sys.path to import the agent
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-# Use importlib to import the module with a hyphen in the filename
-import importlib.util
-
-# Get the absolute path to the agentic-rag.py file
-module_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "agentic-rag.py")
-logging.info(f"Attempting to load module from: {module_path}")
-
-spec = importlib.util.spec_from_file_location("agentic_rag", module_path)
-agentic_rag = importlib.util.module_from_spec(spec)
-sys.modules["agentic_rag"] = agentic_rag
-spec.loader.exec_module(agentic_rag)
+# A regular import is cached in sys.modules, so the agent module is only executed once per process
+import agentic_rag
 
 # Import required functions for direct access
-from coinmarketcap_api import get_cmc_crypto_data, get_cmc_crypto_market_overview
+from coinmarketcap_api import get_cmc_quotes, get_cmc_crypto_market_overview
 
 app = Flask(__name__)
+
+# Reject oversized request bodies with 413 before they are read into memory
+app.config['MAX_CONTENT_LENGTH'] = 1 * 1024 * 1024
 CORS(app, resources={r"/api/*": {"origins": "http://localhost:3000"}})
 
-# Initialize the financial agent
-logging.info("Initializing financial agent... (this may take a minute)")
-financial_agent = agentic_rag.agent
-logging.info("Financial agent initialized and ready!")
+# The financial agent is built by agentic_rag.get_agent() on the first chat request, so the
+# server (and its /health and /api/test endpoints) is up before the agent finishes initializing
+def json_default(obj):
+    """orjson fallback for values it cannot encode natively (LlamaIndex responses, DataFrames, ...)"""
+    if hasattr(obj, 'response'):
+        return str(obj.response)
+    if hasattr(obj, 'to_dict'):
+        return obj.to_dict()
+    return str(obj)
 
-# Custom JSON encoder to handle non-serializable objects
-class CustomJSONEncoder(json.JSONEncoder):
-    def default(self, obj):
-        try:
-            if hasattr(obj, 'to_dict'):
-                return obj.to_dict()
-            elif hasattr(obj, '__dict__'):
-                return obj.__dict__
-            elif hasattr(obj, 'response'):
-                return str(obj.response)
-            return str(obj)
-        except Exception as e:
-            logging.error(f"Error serializing object: {e}")
-            return f"Unserializable object: {str(obj)}"
+ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson, so jsonify() and request.get_json() share the fast path"""
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=json_default, option=ORJSON_OPTIONS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+app.json = OrjsonProvider(app)
+
+def json_response(payload, status=200):
+    """Serialize a small dict of plain values with orjson (or send pre-encoded bytes) as a JSON response"""
+    body = payload if isinstance(payload, bytes) else orjson.dumps(payload, default=json_default, option=ORJSON_OPTIONS)
+    return app.response_class(body, status=status, mimetype='application/json')
+
+# Fixed response bodies encoded once; a fresh Response wraps them per request because
+# after-request hooks (e.g. CORS) add headers to the Response object
+ERR_INVALID_JSON = orjson.dumps({"error": "Invalid JSON payload"})
+ERR_MESSAGES_REQUIRED = orjson.dumps({"error": "Invalid request. 'messages' is required"})
+ERR_NO_USER_MESSAGE = orjson.dumps({"error": "No user message found"})
+ERR_PAYLOAD_TOO_LARGE = orjson.dumps({"error": "Conversation too large"})
+ERR_AGENT_TIMEOUT = orjson.dumps({"error": "The financial agent took too long to respond"})
+ERR_INTERNAL = orjson.dumps({"error": "An internal error occurred"})
+BACKEND_WORKING = orjson.dumps({"message": "Backend is working"})
+SERVER_RUNNING = orjson.dumps({"status": "Server is running"})
+
+# Seconds to wait for the agent before answering 504 (complex queries can take a while)
+AGENT_TIMEOUT = 90
+
+# Agent turns run on one long-lived pool; asyncio.to_thread would use the default executor of the
+# short-lived event loop each async view gets, spawning fresh threads on every request
+AGENT_POOL = ThreadPoolExecutor(max_workers=int(os.getenv("AGENT_WORKERS", "8")), thread_name_prefix="agent")
+
+# Recent agent answers keyed by normalized prompt; short-lived because they quote live market data.
+# Entries are (text, encoded /api/chat body), so cache hits are sent without re-serializing
+RESPONSE_CACHE_TTL = 300
+RESPONSE_CACHE = TTLCache(maxsize=5000, ttl=RESPONSE_CACHE_TTL)
+response_cache_lock = threading.Lock()
+
+def encode_chat_response(text):
+    """Encode an answer as the /api/chat JSON body"""
+    return orjson.dumps({"message": text})
 
-app.json_encoder = CustomJSONEncoder
+def cache_response(key, text, body=None):
+    """Store an answer and its encoded chat body in the response cache"""
+    with response_cache_lock:
+        RESPONSE_CACHE[key] = (text, body if body is not None else encode_chat_response(text))
 
-# Timeout handler
-class TimeoutException(Exception):
-    pass
+def normalize_prompt(message):
+    """Fold case and whitespace so exact repeats share a cache entry; punctuation is kept since "-5%" and "5%" differ"""
+    return " ".join(message.lower().split())
 
-# Check if we're on Windows
-is_windows = platform.system() == 'Windows'
+# Crypto and comparison keywords, matched as whole words in one pass over the lowercased message
+CRYPTO_KEYWORDS_RE = re.compile(r"\b(bitcoin|btc|ethereum|eth|crypto|solana|sol|sui|compare|comparison|vs|versus)\b")
+COMPARISON_KEYWORDS = frozenset({"compare", "comparison", "vs", "versus"})
+ASSET_KEYWORDS = {"bitcoin": "BTC", "btc": "BTC", "ethereum": "ETH", "eth": "ETH", "solana": "SOL", "sol": "SOL", "sui": "SUI"}
 
-# Set up the timeout handler only on Unix systems
-if not is_windows:
-    def timeout_handler(signum, frame):
-        raise TimeoutException("Operation timed out")
-    signal.signal(signal.SIGALRM, timeout_handler)
+# Agent turns currently running, keyed by normalized prompt, so identical concurrent questions share one turn
+INFLIGHT = {}
+inflight_lock = threading.Lock()
 
-# Cross-platform function to run with timeout
-def run_with_timeout(func, args=(), kwargs={}, timeout_duration=45):
-    """Run a function with a timeout"""
-    result = {"value": None, "exception": None}
+def forget_inflight(key, future):
+    """Drop a finished turn from INFLIGHT, unless a newer turn already took its key"""
+    with inflight_lock:
+        if INFLIGHT.get(key) is future:
+            del INFLIGHT[key]
+
+def single_flight(key, func):
+    """Return the AGENT_POOL future running func() for key, joining an identical turn that is already running"""
+    with inflight_lock:
+        future = INFLIGHT.get(key)
+        is_leader = future is None
+        if is_leader:
+            future = INFLIGHT[key] = AGENT_POOL.submit(func)
     
-    def worker():
-        try:
-            result["value"] = func(*args, **kwargs)
-        except Exception as e:
-            result["exception"] = e
+    # Registered outside the lock: a turn that already finished runs the callback right here
+    if is_leader:
+        future.add_done_callback(lambda done: forget_inflight(key, done))
+    return future
+
+# Largest conversation accepted by the chat endpoints
+MAX_MESSAGES = 200
+MAX_CONVERSATION_CHARS = 200_000
+
+def parse_chat_request():
+    """Return (latest user message, None) for a valid chat payload, or (None, error response)"""
+    # Parse the raw body in one orjson pass; the request never needs it again, so don't buffer a copy
+    try:
+        data = orjson.loads(request.get_data(cache=False))
+    except orjson.JSONDecodeError:
+        logging.warning("Invalid JSON payload received")
+        return None, json_response(ERR_INVALID_JSON, 400)
+
+    messages = data.get('messages') if isinstance(data, dict) else None
+    if not isinstance(messages, list):
+        logging.warning("Invalid request: 'messages' is required")
+        return None, json_response(ERR_MESSAGES_REQUIRED, 400)
+    
+    # Bound the transcript the agent path has to handle, independent of the raw body limit
+    if len(messages) > MAX_MESSAGES or sum(
+        len(m.get('content') or '') for m in messages if isinstance(m, dict) and isinstance(m.get('content'), str)
+    ) > MAX_CONVERSATION_CHARS:
+        logging.warning("Rejected oversized conversation (%d messages)", len(messages))
+        return None, json_response(ERR_PAYLOAD_TOO_LARGE, 413)
+    
+    # The latest user turn is almost always the last message, so a plain reverse scan stops immediately
+    user_message = None
+    for m in reversed(messages):
+        if isinstance(m, dict) and m.get('role') == 'user':
+            user_message = m.get('content')
+            break
     
-    if is_windows:
-        # Use threading based timeout for Windows
-        thread = threading.Thread(target=worker)
-        thread.daemon = True
-        thread.start()
-        thread.join(timeout_duration)
-        if thread.is_alive():
-            raise TimeoutException("Operation timed out")
-        if result["exception"]:
-            raise result["exception"]
-        return result["value"]
+    if not user_message or not isinstance(user_message, str):
+        logging.warning("No user message found in the request")
+        return None, json_response(ERR_NO_USER_MESSAGE, 400)
+    
+    return user_message, None
+
+def find_direct_handler(user_message):
+    """Return the dedicated handler for a comparison request it covers, or None if the agent should answer"""
+    # Comparisons of asset pairs with a dedicated handler skip the agent
+    hits = frozenset(CRYPTO_KEYWORDS_RE.findall(user_message.lower()))
+    if not hits & COMPARISON_KEYWORDS:
+        return None
+    assets = frozenset(ASSET_KEYWORDS[hit] for hit in hits if hit in ASSET_KEYWORDS)
+    handler = COMPARISON_HANDLERS.get(assets)
+    if handler is not None:
+        logging.info("Detected %s comparison request", " vs ".join(sorted(assets)))
     else:
-        # Use signal based timeout for Unix systems
-        signal.alarm(timeout_duration)
-        try:
-            result = func(*args, **kwargs)
-            signal.alarm(0)  # Disable the alarm
-            return result
-        finally:
-            signal.alarm(0)  # Ensure the alarm is disabled
+        logging.info("Detected general comparison request - using default agent")
+    return handler
+
+def sse_event(payload):
+    """Encode one Server-Sent Events message carrying a JSON payload"""
+    return b"data: " + orjson.dumps(payload) + b"\n\n"
 
 @app.route('/api/chat', methods=['POST'])
-def chat():
+async def chat():
+    user_message, error_response = parse_chat_request()
+    if error_response is not None:
+        return error_response
+        
+    logging.info("Received query: %s", user_message)
+    
+    # Repeat questions are answered from the response cache without another agent turn
+    cache_key = normalize_prompt(user_message)
+    with response_cache_lock:
+        cached = RESPONSE_CACHE.get(cache_key)
+    if cached is not None:
+        logging.info("Serving cached response")
+        return json_response(cached[1])
+    
     try:
-        try:
-            data = request.json
-        except BadRequest:
-            logging.warning("Invalid JSON payload received")
-            return jsonify({"error": "Invalid JSON payload"}), 400
-
-        if not data or 'messages' not in data:
-            logging.warning("Invalid request: 'messages' is required")
-            return jsonify({"error": "Invalid request. 'messages' is required"}), 400
-            
-        messages = data['messages']
-        user_message = next((m['content'] for m in reversed(messages) if m['role'] == 'user'), None)
+        # The agent call blocks on LLM and data-source I/O, so it runs in a worker thread.
+        # Failed turns and direct-handler answers (which keep their own, shorter-lived cache) skip RESPONSE_CACHE
+        skip_cache = False
         
-        if not user_message:
-            logging.warning("No user message found in the request")
-            return jsonify({"error": "No user message found"}), 400
-            
-        logging.info(f"Received query: {user_message}")
+        def get_agent_response():
+            nonlocal skip_cache
+            try:
+                handler = find_direct_handler(user_message)
+                if handler is not None:
+                    skip_cache = True
+                    return handler()
+                    
+                # Default behavior: use the agent
+                return agentic_rag.run_agent_turn(user_message)
+            except Exception as e:
+                skip_cache = True
+                logging.error(f"Error in agent processing: {str(e)}")
+                return f"I encountered an issue while processing your request: {str(e)}. Please try a different query or check if the required API services are available."
         
-        # Extract conversation history excluding system messages
-        conversation_history = [
-            {"role": m['role'], "content": m['content']} 
-            for m in messages 
-            if m['role'] != 'system'
-        ]
+        def run_turn():
+            response = get_agent_response()
+            return response, skip_cache
         
-        try:
-            # Use the platform-independent timeout function with a longer timeout
-            def get_agent_response():
-                try:
-                    # Check for common requests that might need special handling
-                    lower_message = user_message.lower()
-                    
-                    # Set default response
-                    if any(keyword in lower_message for keyword in ['bitcoin', 'btc', 'eth', 'ethereum', 'crypto', 'sui', 'sol', 'solana', 'compare']):
-                        logging.info("Detected cryptocurrency request, using specialized function")
-                        
-                        # Check for general comparison requests
-                        if ('compare' in lower_message or 'comparison' in lower_message or 'vs' in lower_message or 'versus' in lower_message):
-                            # Check for Bitcoin vs Ethereum comparison
-                            if (('bitcoin' in lower_message or 'btc' in lower_message) and 
-                                ('ethereum' in lower_message or 'eth' in lower_message)):
-                                # Bitcoin vs Ethereum comparison handler
-                                logging.info("Detected Bitcoin vs Ethereum comparison request")
-                                return handle_btc_eth_comparison()
-                            # Check for other cryptocurrency comparisons
-                            elif 'sui' in lower_message and ('sol' in lower_message or 'solana' in lower_message):
-                                logging.info("Detected Sui vs Solana comparison request - using default agent")
-                                # For other cryptocurrency pairs, use the default agent
-                                return financial_agent.chat(user_message)
-                            else:
-                                # For other cryptocurrency comparisons, use the default agent
-                                logging.info("Detected general cryptocurrency comparison - using default agent")
-                                return financial_agent.chat(user_message)
-                        
-                    # Default behavior: use the agent
-                    return financial_agent.chat(user_message)
-                except Exception as e:
-                    logging.error(f"Error in agent processing: {str(e)}")
-                    return f"I encountered an issue while processing your request: {str(e)}. Please try a different query or check if the required API services are available."
-            
-            # Use a longer timeout for more complex queries
-            response = run_with_timeout(get_agent_response, timeout_duration=90)
+        # Await the agent on the shared pool; signal-based alarms only worked on the main thread.
+        # Only the first of several identical questions takes a pool worker, the rest await its future here.
+        # Shielded so one caller's timeout doesn't cancel a turn other callers are still waiting on
+        response, uncacheable = await asyncio.wait_for(
+            asyncio.shield(asyncio.wrap_future(single_flight(cache_key, run_turn))),
+            timeout=AGENT_TIMEOUT
+        )
+        
+        # Only plain text leaves this view, never LlamaIndex response objects
+        if hasattr(response, 'response'):
+            response_text = str(response.response)
+        elif isinstance(response, dict) and 'response' in response:
+            response_text = str(response['response'])
+        else:
+            response_text = str(response)
             
-            if hasattr(response, 'response'):
-                response_text = response.response
-            elif isinstance(response, dict) and 'response' in response:
-                response_text = response['response']
+        # Full answers can run to several KB; log only their size and opening at DEBUG level
+        logging.debug("Response from financial agent: len=%d head=%r", len(response_text), response_text[:120])
+        body = encode_chat_response(response_text)
+        if not uncacheable:
+            cache_response(cache_key, response_text, body)
+        return json_response(body)
+    except asyncio.TimeoutError:
+        logging.error("Financial agent took too long to respond")
+        return json_response(ERR_AGENT_TIMEOUT, 504)
+    except Exception as agent_error:
+        logging.error(f"Agent error: {str(agent_error)}")
+        return json_response({"message": f"I encountered an error processing your request: {str(agent_error)}"}, 500)
+
+@app.route('/api/chat_stream', methods=['POST'])
+def chat_stream():
+    """Stream the agent's answer as Server-Sent Events: {"delta": ...} chunks followed by {"done": true}"""
+    user_message, error_response = parse_chat_request()
+    if error_response is not None:
+        return error_response
+    
+    logging.info("Received streaming query: %s", user_message)
+    cache_key = normalize_prompt(user_message)
+    
+    def generate():
+        with response_cache_lock:
+            cached = RESPONSE_CACHE.get(cache_key)
+        if cached is not None:
+            logging.info("Serving cached response")
+            yield sse_event({"delta": cached[0]})
+            yield sse_event({"done": True})
+            return
+        
+        try:
+            handler = find_direct_handler(user_message)
+            if handler is not None:
+                # Direct handlers build their whole answer at once, so it goes out as a single delta
+                deltas = [handler()]
             else:
-                response_text = str(response)
-                
-            logging.info(f"Response from financial agent: {response_text}")
-            return jsonify({"message": response_text})
-        except TimeoutException:
-            logging.error("Financial agent took too long to respond")
-            return jsonify({"error": "The financial agent took too long to respond"}), 504
-        except Exception as agent_error:
-            logging.error(f"Agent error: {str(agent_error)}")
-            return jsonify({"message": f"I encountered an error processing your request: {str(agent_error)}"}), 500
+                # Tokens are forwarded as soon as the LLM decodes them
+                deltas = agentic_rag.stream_agent_turn(user_message)
+            parts = []
+            for delta in deltas:
+                parts.append(delta)
+                yield sse_event({"delta": delta})
+        except Exception as e:
+            logging.error(f"Agent error while streaming: {str(e)}")
+            yield sse_event({"error": f"I encountered an error processing your request: {str(e)}"})
+            return
+        
+        # Direct-handler answers are cached (only when built from live data) by the handler itself
+        if handler is None:
+            cache_response(cache_key, "".join(parts))
+        yield sse_event({"done": True})
     
-    except Exception as e:
-        logging.error(f"Unhandled error in chat endpoint: {str(e)}")
-        return jsonify({"error": f"An error occurred: {str(e)}"}), 500
+    # Disable proxy buffering so each event reaches the client immediately
+    headers = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    # Keep the request context alive while the generator runs after the view has returned
+    return app.response_class(stream_with_context(generate()), mimetype='text/event-stream', headers=headers)
 
 @app.route('/api/test', methods=['GET'])
 def test():
     logging.info("Test endpoint hit")
-    return jsonify({"message": "Backend is working"})
+    return json_response(BACKEND_WORKING)
 
 @app.route('/health')
 def health_check():
-    return jsonify({"status": "Server is running"}), 200
+    return json_response(SERVER_RUNNING, 200)
+
+@app.after_request
+def add_conditional_get(response):
+    # Fixed GET bodies (/health, /api/test) get an ETag so clients and proxies can revalidate with a 304;
+    # chat answers are POST responses and are never served conditionally
+    if request.method == 'GET' and response.status_code == 200 and not response.is_streamed:
+        response.add_etag()
+        return response.make_conditional(request)
+    return response
+
+@app.errorhandler(HTTPException)
+def handle_http_exception(e):
+    # Routing and protocol errors (404, 405, ...) keep their own status instead of becoming a 500
+    return json_response({"error": e.description}, e.code)
 
 @app.errorhandler(Exception)
 def handle_exception(e):
     logging.error(f"Unhandled exception: {str(e)}")
-    return jsonify({"error": "An internal error occurred"}), 500
+    return json_response(ERR_INTERNAL, 500)
+
+# CMC quotes only move meaningfully at minute resolution, so a built comparison is reused for a minute
+COMPARISON_CACHE_TTL = 60
+COMPARISON_CACHE = TTLCache(maxsize=8, ttl=COMPARISON_CACHE_TTL)
+comparison_cache_lock = threading.Lock()
 
 # Handle Bitcoin vs Ethereum comparison
 def handle_btc_eth_comparison():
-    """Creates a detailed comparison between Bitcoin and Ethereum"""
+    """Returns the Bitcoin vs Ethereum comparison, rebuilding it from live data at most once a minute"""
+    key = ('BTC', 'ETH')
+    with comparison_cache_lock:
+        cached_text = COMPARISON_CACHE.get(key)
+    if cached_text is not None:
+        logging.info("Serving cached Bitcoin vs Ethereum comparison")
+        return cached_text
+    
+    custom_response, complete = build_btc_eth_comparison()
+    # Fallback text from a failed data fetch is not cached, so the next request retries the APIs
+    if complete:
+        with comparison_cache_lock:
+            COMPARISON_CACHE[key] = custom_response
+    return custom_response
+
+# CmcQuote field, section heading and phrasing for each performance window in the comparison
+PERFORMANCE_WINDOWS = (
+    ('percent_change_24h', "24 Hour", "in the last 24 hours"),
+    ('percent_change_7d', "7 Day", "over the last week"),
+    ('percent_change_30d', "30 Day", "over the last month"),
+)
+
+# Static prose of the comparison, assembled once at import
+BTC_ETH_SUMMARY = (
+    "### Summary\n"
+    "Bitcoin remains the dominant cryptocurrency in terms of market capitalization and price, acting primarily as a store of value and digital gold. "
+    "Ethereum, on the other hand, offers smart contract functionality and serves as the foundation for decentralized applications, DeFi, and NFTs.\n\n"
+    "### Investment Perspective\n"
+)
+BTC_ETH_FALLBACK = (
+    "I encountered an error while creating the comparison analysis. Here's what I know:\n\n"
+    "Bitcoin (BTC) is the first and largest cryptocurrency by market capitalization, often compared to digital gold and primarily used as a store of value. It has a fixed supply cap of 21 million coins.\n\n"
+    "Ethereum (ETH) is the second-largest cryptocurrency and offers smart contract functionality, serving as the foundation for thousands of decentralized applications, DeFi protocols, and NFTs. Unlike Bitcoin, Ethereum does not have a fixed maximum supply.\n\n"
+    "Both have different use cases and investment characteristics, with Bitcoin generally considered more of a store of value while Ethereum aims to be a decentralized computing platform."
+)
+
+def build_btc_eth_comparison():
+    """Creates a detailed comparison between Bitcoin and Ethereum; returns (text, built from live data)"""
     logging.info("Creating Bitcoin vs Ethereum comparison")
-    custom_response = "I'll provide a comparison analysis of Bitcoin and Ethereum for you:\n\n"
+    # Sections are collected and joined once instead of re-copying the growing string on every +=
+    parts = ["I'll provide a comparison analysis of Bitcoin and Ethereum for you:\n\n"]
+    complete = False
     
     try:
-        # Get data for both cryptocurrencies
-        btc_data = get_cmc_crypto_data('BTC')
-        eth_data = get_cmc_crypto_data('ETH')
+        # Get quotes for both cryptocurrencies in one batched request; a missing quote leads to the fallback text
+        quotes = get_cmc_quotes(['BTC', 'ETH'])
+        btc, eth = quotes.get('BTC'), quotes.get('ETH')
         
         # Format comparison response
-        custom_response += "## Bitcoin vs Ethereum Comparison\n\n"
+        parts.append("## Bitcoin vs Ethereum Comparison\n\n")
         
-        # Extract key metrics for comparison
-        if isinstance(btc_data, dict) and isinstance(eth_data, dict):
-            btc_quotes = btc_data.get('quotes', {})
-            eth_quotes = eth_data.get('quotes', {})
-            
+        # Compare key metrics
+        if btc is not None and eth is not None:
             # Price comparison
-            custom_response += "### Current Price\n"
-            if 'quote' in btc_quotes and 'USD' in btc_quotes['quote'] and \
-               'quote' in eth_quotes and 'USD' in eth_quotes['quote']:
-                btc_price = btc_quotes['quote']['USD'].get('price', 0)
-                eth_price = eth_quotes['quote']['USD'].get('price', 0)
-                price_ratio = btc_price / eth_price if eth_price else 0
-                
-                custom_response += f"- Bitcoin: ${btc_price:,.2f}\n"
-                custom_response += f"- Ethereum: ${eth_price:,.2f}\n"
-                custom_response += f"- BTC is {price_ratio:.1f}x more expensive than ETH\n\n"
+            btc_price = btc.price
+            eth_price = eth.price
+            price_ratio = btc_price / eth_price if eth_price else 0
+            parts.append("### Current Price\n")
+            parts.append(f"- Bitcoin: ${btc_price:,.2f}\n")
+            parts.append(f"- Ethereum: ${eth_price:,.2f}\n")
+            parts.append(f"- BTC is {price_ratio:.1f}x more expensive than ETH\n\n")
             
             # Market Cap comparison
-            custom_response += "### Market Capitalization\n"
-            if 'quote' in btc_quotes and 'USD' in btc_quotes['quote'] and \
-               'quote' in eth_quotes and 'USD' in eth_quotes['quote']:
-                btc_mcap = btc_quotes['quote']['USD'].get('market_cap', 0)
-                eth_mcap = eth_quotes['quote']['USD'].get('market_cap', 0)
-                mcap_ratio = btc_mcap / eth_mcap if eth_mcap else 0
-                
-                custom_response += f"- Bitcoin: ${btc_mcap:,.2f}\n"
-                custom_response += f"- Ethereum: ${eth_mcap:,.2f}\n"
-                custom_response += f"- BTC market cap is {mcap_ratio:.1f}x larger than ETH\n\n"
+            btc_mcap = btc.market_cap
+            eth_mcap = eth.market_cap
+            mcap_ratio = btc_mcap / eth_mcap if eth_mcap else 0
+            parts.append("### Market Capitalization\n")
+            parts.append(f"- Bitcoin: ${btc_mcap:,.2f}\n")
+            parts.append(f"- Ethereum: ${eth_mcap:,.2f}\n")
+            parts.append(f"- BTC market cap is {mcap_ratio:.1f}x larger than ETH\n\n")
             
-            # Performance comparison
-            custom_response += "### Performance Comparison\n"
-            if 'quote' in btc_quotes and 'USD' in btc_quotes['quote'] and \
-               'quote' in eth_quotes and 'USD' in eth_quotes['quote']:
-                # 24h change
-                btc_24h = btc_quotes['quote']['USD'].get('percent_change_24h', 0)
-                eth_24h = eth_quotes['quote']['USD'].get('percent_change_24h', 0)
-                
-                # 7d change
-                btc_7d = btc_quotes['quote']['USD'].get('percent_change_7d', 0)
-                eth_7d = eth_quotes['quote']['USD'].get('percent_change_7d', 0)
-                
-                # 30d change
-                btc_30d = btc_quotes['quote']['USD'].get('percent_change_30d', 0)
-                eth_30d = eth_quotes['quote']['USD'].get('percent_change_30d', 0)
-                
-                custom_response += "#### 24 Hour Performance\n"
-                custom_response += f"- Bitcoin: {btc_24h:.2f}%\n"
-                custom_response += f"- Ethereum: {eth_24h:.2f}%\n"
-                if btc_24h > eth_24h:
-                    custom_response += f"- Bitcoin is outperforming Ethereum by {btc_24h - eth_24h:.2f}% in the last 24 hours\n\n"
+            # Performance comparison over 24h, 7d and 30d
+            parts.append("### Performance Comparison\n")
+            for field, heading, window in PERFORMANCE_WINDOWS:
+                btc_change = getattr(btc, field)
+                eth_change = getattr(eth, field)
+                parts.append(f"#### {heading} Performance\n")
+                parts.append(f"- Bitcoin: {btc_change:.2f}%\n")
+                parts.append(f"- Ethereum: {eth_change:.2f}%\n")
+                if btc_change > eth_change:
+                    parts.append(f"- Bitcoin is outperforming Ethereum by {btc_change - eth_change:.2f}% {window}\n\n")
                 else:
-                    custom_response += f"- Ethereum is outperforming Bitcoin by {eth_24h - btc_24h:.2f}% in the last 24 hours\n\n"
-                    
-                custom_response += "#### 7 Day Performance\n"
-                custom_response += f"- Bitcoin: {btc_7d:.2f}%\n"
-                custom_response += f"- Ethereum: {eth_7d:.2f}%\n"
-                if btc_7d > eth_7d:
-                    custom_response += f"- Bitcoin is outperforming Ethereum by {btc_7d - eth_7d:.2f}% over the last week\n\n"
-                else:
-                    custom_response += f"- Ethereum is outperforming Bitcoin by {eth_7d - btc_7d:.2f}% over the last week\n\n"
-                    
-                custom_response += "#### 30 Day Performance\n"
-                custom_response += f"- Bitcoin: {btc_30d:.2f}%\n"
-                custom_response += f"- Ethereum: {eth_30d:.2f}%\n"
-                if btc_30d > eth_30d:
-                    custom_response += f"- Bitcoin is outperforming Ethereum by {btc_30d - eth_30d:.2f}% over the last month\n\n"
-                else:
-                    custom_response += f"- Ethereum is outperforming Bitcoin by {eth_30d - btc_30d:.2f}% over the last month\n\n"
+                    parts.append(f"- Ethereum is outperforming Bitcoin by {eth_change - btc_change:.2f}% {window}\n\n")
+            btc_7d = btc.percent_change_7d
+            eth_7d = eth.percent_change_7d
             
             # Supply comparison
-            custom_response += "### Supply Information\n"
-            btc_supply = btc_quotes.get('circulating_supply', 0)
-            eth_supply = eth_quotes.get('circulating_supply', 0)
-            btc_max = btc_quotes.get('max_supply', 0)
-            
-            custom_response += f"- Bitcoin Circulating Supply: {btc_supply:,.0f} BTC\n"
-            custom_response += f"- Bitcoin Max Supply: {btc_max:,.0f} BTC\n"
-            custom_response += f"- Ethereum Circulating Supply: {eth_supply:,.0f} ETH\n"
-            custom_response += f"- Unlike Bitcoin, Ethereum does not have a fixed maximum supply cap\n\n"
+            btc_supply = btc.circulating_supply
+            eth_supply = eth.circulating_supply
+            btc_max = btc.max_supply
+            parts.append("### Supply Information\n")
+            parts.append(f"- Bitcoin Circulating Supply: {btc_supply:,.0f} BTC\n")
+            parts.append(f"- Bitcoin Max Supply: {btc_max:,.0f} BTC\n")
+            parts.append(f"- Ethereum Circulating Supply: {eth_supply:,.0f} ETH\n")
+            parts.append("- Unlike Bitcoin, Ethereum does not have a fixed maximum supply cap\n\n")
             
             # Trading volume comparison
-            custom_response += "### Trading Volume (24h)\n"
-            if 'quote' in btc_quotes and 'USD' in btc_quotes['quote'] and \
-               'quote' in eth_quotes and 'USD' in eth_quotes['quote']:
-                btc_vol = btc_quotes['quote']['USD'].get('volume_24h', 0)
-                eth_vol = eth_quotes['quote']['USD'].get('volume_24h', 0)
-                vol_ratio = btc_vol / eth_vol if eth_vol else 0
-                
-                custom_response += f"- Bitcoin: ${btc_vol:,.2f}\n"
-                custom_response += f"- Ethereum: ${eth_vol:,.2f}\n"
-                custom_response += f"- BTC trading volume is {vol_ratio:.1f}x larger than ETH\n\n"
+            btc_vol = btc.volume_24h
+            eth_vol = eth.volume_24h
+            vol_ratio = btc_vol / eth_vol if eth_vol else 0
+            parts.append("### Trading Volume (24h)\n")
+            parts.append(f"- Bitcoin: ${btc_vol:,.2f}\n")
+            parts.append(f"- Ethereum: ${eth_vol:,.2f}\n")
+            parts.append(f"- BTC trading volume is {vol_ratio:.1f}x larger than ETH\n\n")
             
             # Market dominance comparison
-            custom_response += "### Market Dominance\n"
-            if 'quote' in btc_quotes and 'USD' in btc_quotes['quote'] and \
-               'quote' in eth_quotes and 'USD' in eth_quotes['quote']:
-                btc_dom = btc_quotes['quote']['USD'].get('market_cap_dominance', 0)
-                eth_dom = eth_quotes['quote']['USD'].get('market_cap_dominance', 0)
-                
-                custom_response += f"- Bitcoin: {btc_dom:.2f}%\n"
-                custom_response += f"- Ethereum: {eth_dom:.2f}%\n\n"
-            
-            # Summary and analysis
-            custom_response += "### Summary\n"
-            custom_response += "Bitcoin remains the dominant cryptocurrency in terms of market capitalization and price, acting primarily as a store of value and digital gold. "
-            custom_response += "Ethereum, on the other hand, offers smart contract functionality and serves as the foundation for decentralized applications, DeFi, and NFTs.\n\n"
+            btc_dom = btc.market_cap_dominance
+            eth_dom = eth.market_cap_dominance
+            parts.append("### Market Dominance\n")
+            parts.append(f"- Bitcoin: {btc_dom:.2f}%\n")
+            parts.append(f"- Ethereum: {eth_dom:.2f}%\n\n")
             
-            # Investment perspectives
-            custom_response += "### Investment Perspective\n"
+            # Summary and analysis, then investment perspectives
+            parts.append(BTC_ETH_SUMMARY)
             if btc_7d > 0 and eth_7d > 0:
-                custom_response += "Both assets are showing positive momentum in the current market. "
+                parts.append("Both assets are showing positive momentum in the current market. ")
                 if btc_7d > eth_7d:
-                    custom_response += "Bitcoin is currently outperforming Ethereum, which might suggest a market preference for the more established cryptocurrency in the current environment."
+                    parts.append("Bitcoin is currently outperforming Ethereum, which might suggest a market preference for the more established cryptocurrency in the current environment.")
                 else:
-                    custom_response += "Ethereum is currently outperforming Bitcoin, which might indicate growing interest in smart contract platforms and the broader Ethereum ecosystem."
+                    parts.append("Ethereum is currently outperforming Bitcoin, which might indicate growing interest in smart contract platforms and the broader Ethereum ecosystem.")
             elif btc_7d > 0 and eth_7d <= 0:
-                custom_response += "Bitcoin is showing positive momentum while Ethereum is declining, which could indicate a flight to the more established cryptocurrency in uncertain market conditions."
+                parts.append("Bitcoin is showing positive momentum while Ethereum is declining, which could indicate a flight to the more established cryptocurrency in uncertain market conditions.")
             elif btc_7d <= 0 and eth_7d > 0:
-                custom_response += "Ethereum is showing positive momentum while Bitcoin is declining, which might signal growing interest in smart contract platforms over pure store-of-value cryptocurrencies."
+                parts.append("Ethereum is showing positive momentum while Bitcoin is declining, which might signal growing interest in smart contract platforms over pure store-of-value cryptocurrencies.")
             else:
-                custom_response += "Both assets are currently in a downtrend, reflecting broader market uncertainty. During such periods, cryptocurrency markets often experience increased volatility."
+                parts.append("Both assets are currently in a downtrend, reflecting broader market uncertainty. During such periods, cryptocurrency markets often experience increased volatility.")
+            complete = True
         else:
-            custom_response += "I couldn't retrieve detailed data for both cryptocurrencies to make a proper comparison.\n\n"
+            parts.append("I couldn't retrieve detailed data for both cryptocurrencies to make a proper comparison.\n\n")
     except Exception as e:
         logging.error(f"Error creating comparison analysis: {str(e)}")
-        custom_response += "I encountered an error while creating the comparison analysis. Here's what I know:\n\n"
-        custom_response += "Bitcoin (BTC) is the first and largest cryptocurrency by market capitalization, often compared to digital gold and primarily used as a store of value. It has a fixed supply cap of 21 million coins.\n\n"
-        custom_response += "Ethereum (ETH) is the second-largest cryptocurrency and offers smart contract functionality, serving as the foundation for thousands of decentralized applications, DeFi protocols, and NFTs. Unlike Bitcoin, Ethereum does not have a fixed maximum supply.\n\n"
-        custom_response += "Both have different use cases and investment characteristics, with Bitcoin generally considered more of a store of value while Ethereum aims to be a decentralized computing platform."
+        parts.append(BTC_ETH_FALLBACK)
     
-    return custom_response
+    return "".join(parts), complete
+
+# Direct handlers for comparison requests, keyed by the set of assets the message names
+COMPARISON_HANDLERS = {
+    frozenset({"BTC", "ETH"}): handle_btc_eth_comparison,
+}
 
 if __name__ == '__main__':
     logging.info("Starting Financial Agent API server on http://localhost:5000")
-    app.run(host='0.0.0.0', port=5000, debug=True)
\ No newline at end of file
+    # Development server only; production deployments serve wsgi:application with gunicorn (see README)
+    # Debug mode (and its interactive debugger) is opt-in; the reloader would import and build the agent twice
+    app.run(host='0.0.0.0', port=5000, debug=os.environ.get('FLASK_DEBUG') == '1', use_reloader=False, threaded=True)
\ No newline at end of file
@@ -1,5 +1,6 @@
+import threading
 import pytest
-from app import app
+from app import app, RESPONSE_CACHE, single_flight
 
 # ------------------------------
 # Unit Tests
@@ -8,6 +9,7 @@ from app import app
 def client():
     """Fixture to create a test client for the Flask app."""
     app.config['TESTING'] = True
+    RESPONSE_CACHE.clear()
     with app.test_client() as client:
         yield client
 
@@ -49,17 +51,107 @@ def test_chat_endpoint_agent_error(client, mocker):
             {"role": "user", "content": "What is the current stock price of AAPL?"}
         ]
     }
-    # Mock the financial_agent.chat method to raise an exception
-    mocker.patch('agentic_rag.agent.chat', side_effect=Exception("Agent error"))
+    # Failed agent turns are answered with an explanation, and are not cached
+    agent_turn = mocker.patch('agentic_rag.run_agent_turn', side_effect=Exception("Agent error"))
     response = client.post('/api/chat', json=payload)
-    assert response.status_code == 500
-    assert "I encountered an error processing your request" in response.json["message"]
+    assert response.status_code == 200
+    assert response.json["message"].startswith("I encountered an issue while processing your request: Agent error.")
+    client.post('/api/chat', json=payload)
+    assert agent_turn.call_count == 2
+
+def test_chat_endpoint_cached_response(client, mocker):
+    """Unit Test: Test that a repeated question is answered from the response cache."""
+    agent_turn = mocker.patch('agentic_rag.run_agent_turn', return_value="AAPL is trading at $150.")
+    first = client.post('/api/chat', json={"messages": [{"role": "user", "content": "What is the price of AAPL?"}]})
+    second = client.post('/api/chat', json={"messages": [{"role": "user", "content": "  what is the  price of aapl? "}]})
+    assert first.status_code == 200
+    assert second.status_code == 200
+    assert second.json == first.json == {"message": "AAPL is trading at $150."}
+    agent_turn.assert_called_once()
+
+def test_chat_endpoint_cache_keeps_punctuation(client, mocker):
+    """Unit Test: Test that prompts differing only in meaningful punctuation do not share a cached answer."""
+    mocker.patch('agentic_rag.run_agent_turn', side_effect=["Down 5%.", "Up 5%."])
+    first = client.post('/api/chat', json={"messages": [{"role": "user", "content": "What if BTC-USD drops -5%?"}]})
+    second = client.post('/api/chat', json={"messages": [{"role": "user", "content": "What if BTC USD drops 5%?"}]})
+    assert first.json == {"message": "Down 5%."}
+    assert second.json == {"message": "Up 5%."}
+
+def test_chat_stream_endpoint(client, mocker):
+    """Unit Test: Test that /api/chat_stream runs the agent's tools and streams the LLM's answer as Server-Sent Events."""
+    from llama_index.core.llms import ChatMessage, ChatResponse
+    from llama_index.core.tools import FunctionTool, ToolSelection
+    
+    get_price = mocker.Mock(return_value="150.00")
+    price_tool = FunctionTool.from_defaults(fn=lambda symbol: get_price(symbol), name="get_price", description="Latest price")
+    mocker.patch('agentic_rag.get_tools', return_value=[price_tool])
+    mocker.patch('agentic_rag.get_agent').return_value.memory.get.return_value = []
+    
+    # First round asks for a tool, second round streams the answer
+    tool_round = ChatResponse(message=ChatMessage(role="assistant", content=""), delta="")
+    answer_round = [
+        ChatResponse(message=ChatMessage(role="assistant", content="AAPL is "), delta="AAPL is "),
+        ChatResponse(message=ChatMessage(role="assistant", content="AAPL is trading at $150."), delta="trading at $150."),
+    ]
+    llm = mocker.patch('agentic_rag.Settings').llm
+    llm.stream_chat_with_tools.side_effect = [iter([tool_round]), iter(answer_round)]
+    llm.get_tool_calls_from_response.side_effect = [
+        [ToolSelection(tool_id="call_1", tool_name="get_price", tool_kwargs={"symbol": "AAPL"})],
+        [],
+    ]
+    
+    payload = {"messages": [{"role": "user", "content": "What is the current stock price of AAPL?"}]}
+    response = client.post('/api/chat_stream', json=payload)
+    assert response.status_code == 200
+    assert response.mimetype == "text/event-stream"
+    assert response.get_data(as_text=True) == (
+        'data: {"delta":"AAPL is "}\n\n'
+        'data: {"delta":"trading at $150."}\n\n'
+        'data: {"done":true}\n\n'
+    )
+    get_price.assert_called_once_with("AAPL")
+    tool_message = llm.stream_chat_with_tools.call_args_list[1].kwargs["chat_history"][-1]
+    assert tool_message.content == "150.00"
+    assert tool_message.additional_kwargs["tool_call_id"] == "call_1"
+
+def test_single_flight_shares_running_turn():
+    """Unit Test: Test that an identical question joins the running turn instead of taking another pool worker."""
+    release = threading.Event()
+    calls = []
+    
+    def turn():
+        calls.append(1)
+        release.wait(5)
+        return "answer"
+    
+    first = single_flight("same question", turn)
+    second = single_flight("same question", turn)
+    assert second is first
+    release.set()
+    assert first.result(timeout=5) == "answer"
+    assert len(calls) == 1
+
+def test_chat_endpoint_oversized_conversation(client):
+    """Unit Test: Test that the /api/chat endpoint rejects conversations above the size limits."""
+    payload = {"messages": [{"role": "user", "content": "hi"}] * 201}
+    response = client.post('/api/chat', json=payload)
+    assert response.status_code == 413
+    assert response.json == {"error": "Conversation too large"}
 
 def test_chat_endpoint_invalid_json(client):
     """Unit Test: Test the /api/chat endpoint with invalid JSON payload."""
     response = client.post('/api/chat', data="Invalid JSON", content_type='application/json')
     assert response.status_code == 400  # Flask automatically returns 400 for malformed JSON
 
+def test_health_endpoint_conditional_get(client):
+    """Unit Test: Test that /health answers a matching If-None-Match with 304."""
+    response = client.get('/health')
+    assert response.status_code == 200
+    etag = response.headers['ETag']
+    response = client.get('/health', headers={'If-None-Match': etag})
+    assert response.status_code == 304
+    assert response.data == b''
+
 # ------------------------------
 # Integration Tests
 # ------------------------------
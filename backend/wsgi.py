@@ -0,0 +1,13 @@
+# WSGI entry point for production servers, e.g. from the backend directory:
+#   gunicorn -k gthread -w 2 --threads 8 --timeout 120 wsgi:application
+import os
+
+from app import app, agentic_rag
+
+# Optionally build the agent (and its document index) while the worker boots, so the first chat
+# request doesn't pay for it. Don't combine with gunicorn --preload: the agent's HTTP clients
+# should be created in the worker process, not inherited across fork
+if os.environ.get("PRELOAD_AGENT") == "1":
+    agentic_rag.get_agent()
+
+application = app
@@ -1,12 +1,64 @@
 import os
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import functools
 import json
-from typing import Dict, List, Optional, Any
+import re
+import time
+import orjson
+from bisect import bisect_right
+import threading
+from cachetools import TTLCache
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Any, NamedTuple, Union
 from datetime import datetime
 
 # CoinMarketCap API base URL
 CMC_API_BASE_URL = "https://pro-api.coinmarketcap.com/v1"
 
+# One connection pool shared by every client session, so keep-alive TLS connections to CoinMarketCap
+# survive across helper calls instead of being opened and dropped per call. Rate limits (429) and
+# transient server errors get a few quick retries (0.3s, 0.6s, 1.2s backoff). Retry-After is ignored, since
+# CoinMarketCap asks for up to a minute and a persistent 429 is left to the circuit breaker instead. Read
+# timeouts are not retried, so one call waits at most one read timeout plus about two seconds of backoff
+_HTTP_ADAPTER = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=64,
+    max_retries=Retry(
+        total=3,
+        read=0,
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(["GET"]),
+        respect_retry_after_header=False,
+        raise_on_status=False
+    )
+)
+
+# (connect, read) timeout in seconds for every request, so a stalled endpoint can't hang a worker
+REQUEST_TIMEOUT = (3.05, 10)
+
+# After this many consecutive outage-type failures (timeouts, connection errors, 429/5xx) the client stops
+# calling CoinMarketCap for CIRCUIT_RESET_SECONDS, then lets one request through to probe for recovery
+CIRCUIT_FAILURE_THRESHOLD = 5
+CIRCUIT_RESET_SECONDS = 30
+
+# Independent endpoint requests made by one helper overlap on this pool instead of running back to back
+_REQUEST_POOL = ThreadPoolExecutor(max_workers=16, thread_name_prefix="cmc")
+
+# Seconds a successful response stays fresh, per endpoint: metadata barely changes, quotes move constantly
+RESPONSE_CACHE_TTLS = {
+    "listings": 60,
+    "info": 3600,
+    "quotes": 30,
+    "global": 60,
+    "ohlcv": 300,
+    "pairs": 120,
+}
+_RESPONSE_CACHES = {endpoint: TTLCache(maxsize=256, ttl=ttl) for endpoint, ttl in RESPONSE_CACHE_TTLS.items()}
+_response_cache_lock = threading.Lock()
+
 class CoinMarketCapAPI:
     """
     Client for interacting with CoinMarketCap's REST API
@@ -24,10 +76,66 @@ class CoinMarketCapAPI:
             raise ValueError("CoinMarketCap API key is required")
             
         self.session = requests.Session()
+        self.session.mount("https://", _HTTP_ADAPTER)
         self.session.headers.update({
             "X-CMC_PRO_API_KEY": self.api_key,
             "Accept": "application/json"
         })
+        self.timeout = REQUEST_TIMEOUT
+        
+        # Circuit breaker state
+        self._failures = 0
+        self._opened_at = 0.0
+        self._breaker_lock = threading.Lock()
+    
+    def _get(self, url: str, params: Dict, endpoint: str) -> Dict:
+        """
+        GET a CoinMarketCap endpoint and return its decoded JSON body
+        
+        Successful raw bodies are shared across clients for the endpoint's RESPONSE_CACHE_TTLS entry, keyed by
+        URL and parameters, and every caller gets a freshly decoded copy. HTTP and decode errors raise as
+        requests exceptions, as does a call made while the circuit breaker is open.
+        """
+        key = (url, tuple(sorted(params.items())))
+        cache = _RESPONSE_CACHES[endpoint]
+        with _response_cache_lock:
+            body = cache.get(key)
+        if body is not None:
+            return orjson.loads(body)
+        
+        with self._breaker_lock:
+            if self._failures >= CIRCUIT_FAILURE_THRESHOLD:
+                now = time.monotonic()
+                if now - self._opened_at < CIRCUIT_RESET_SECONDS:
+                    raise requests.exceptions.ConnectionError("CoinMarketCap circuit open after repeated failures; retrying shortly")
+                # Half-open: this caller probes, and restarting the window keeps everyone else out meanwhile
+                self._opened_at = now
+        
+        try:
+            response = self.session.get(url, params=params, timeout=self.timeout)
+            response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            # Client errors (bad symbol, bad key) say nothing about CoinMarketCap's health
+            status = e.response.status_code if e.response is not None else None
+            if status is None or status == 429 or status >= 500:
+                with self._breaker_lock:
+                    self._failures += 1
+                    if self._failures >= CIRCUIT_FAILURE_THRESHOLD:
+                        self._opened_at = time.monotonic()
+            raise
+        with self._breaker_lock:
+            self._failures = 0
+        
+        # orjson parses the raw bytes directly, without requests' text decode and stdlib json pass
+        body = response.content
+        try:
+            data = orjson.loads(body)
+        except orjson.JSONDecodeError as e:
+            raise requests.exceptions.InvalidJSONError(f"Invalid JSON from CoinMarketCap: {e}", response=response)
+        if "data" in data:
+            with _response_cache_lock:
+                cache[key] = body
+        return data
     
     def get_latest_listings(self, limit: int = 100, convert: str = "USD") -> Dict:
         """
@@ -47,9 +155,7 @@ class CoinMarketCapAPI:
         }
         
         try:
-            response = self.session.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
+            data = self._get(url, params, "listings")
             
             if "data" in data:
                 return {
@@ -62,26 +168,32 @@ class CoinMarketCapAPI:
         except requests.exceptions.RequestException as e:
             return {"error": f"Error fetching latest listings: {str(e)}"}
     
-    def get_cryptocurrency_info(self, symbol: str) -> Dict:
+    def get_cryptocurrency_info(self, symbol: Union[str, List[str]]) -> Dict:
         """
         Get metadata about a cryptocurrency
         
         Parameters:
-        - symbol: Cryptocurrency symbol (e.g., "BTC", "ETH")
+        - symbol: Cryptocurrency symbol (e.g., "BTC", "ETH"), or a list of symbols fetched in one request
         
         Returns:
-        - Dictionary containing cryptocurrency metadata
+        - Dictionary containing cryptocurrency metadata; for a list, "data" maps each symbol found to its metadata
         """
         url = f"{CMC_API_BASE_URL}/cryptocurrency/info"
         params = {
-            "symbol": symbol
+            "symbol": symbol if isinstance(symbol, str) else ",".join(symbol)
         }
         
         try:
-            response = self.session.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
+            data = self._get(url, params, "info")
             
+            if not isinstance(symbol, str):
+                if "data" not in data:
+                    return {"error": "No data returned from CoinMarketCap API"}
+                return {
+                    "status": data.get("status", {}),
+                    "data": {s: data["data"][s] for s in symbol if s in data["data"]},
+                    "timestamp": datetime.now().isoformat()
+                }
             if "data" in data and symbol in data["data"]:
                 return {
                     "status": data.get("status", {}),
@@ -93,28 +205,34 @@ class CoinMarketCapAPI:
         except requests.exceptions.RequestException as e:
             return {"error": f"Error fetching cryptocurrency info: {str(e)}"}
     
-    def get_cryptocurrency_quotes(self, symbol: str, convert: str = "USD") -> Dict:
+    def get_cryptocurrency_quotes(self, symbol: Union[str, List[str]], convert: str = "USD") -> Dict:
         """
         Get latest market quotes for a cryptocurrency
         
         Parameters:
-        - symbol: Cryptocurrency symbol (e.g., "BTC", "ETH")
+        - symbol: Cryptocurrency symbol (e.g., "BTC", "ETH"), or a list of symbols fetched in one request
         - convert: Currency to convert prices to (default USD)
         
         Returns:
-        - Dictionary containing cryptocurrency quotes data
+        - Dictionary containing cryptocurrency quotes data; for a list, "data" maps each symbol found to its quote
         """
         url = f"{CMC_API_BASE_URL}/cryptocurrency/quotes/latest"
         params = {
-            "symbol": symbol,
+            "symbol": symbol if isinstance(symbol, str) else ",".join(symbol),
             "convert": convert
         }
         
         try:
-            response = self.session.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
+            data = self._get(url, params, "quotes")
             
+            if not isinstance(symbol, str):
+                if "data" not in data:
+                    return {"error": "No data returned from CoinMarketCap API"}
+                return {
+                    "status": data.get("status", {}),
+                    "data": {s: data["data"][s] for s in symbol if s in data["data"]},
+                    "timestamp": datetime.now().isoformat()
+                }
             if "data" in data and symbol in data["data"]:
                 return {
                     "status": data.get("status", {}),
@@ -142,9 +260,7 @@ class CoinMarketCapAPI:
         }
         
         try:
-            response = self.session.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
+            data = self._get(url, params, "global")
             
             if "data" in data:
                 return {
@@ -179,9 +295,7 @@ class CoinMarketCapAPI:
         }
         
         try:
-            response = self.session.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
+            data = self._get(url, params, "ohlcv")
             
             if "data" in data and symbol in data["data"]:
                 return {
@@ -212,9 +326,7 @@ class CoinMarketCapAPI:
         }
         
         try:
-            response = self.session.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
+            data = self._get(url, params, "pairs")
             
             if "data" in data and symbol in data["data"]:
                 return {
@@ -227,8 +339,85 @@ class CoinMarketCapAPI:
         except requests.exceptions.RequestException as e:
             return {"error": f"Error fetching market pairs: {str(e)}"}
 
+class CmcQuote(NamedTuple):
+    """Latest USD market snapshot of one cryptocurrency"""
+    symbol: str
+    price: float
+    market_cap: float
+    volume_24h: float
+    percent_change_24h: float
+    percent_change_7d: float
+    percent_change_30d: float
+    market_cap_dominance: float
+    circulating_supply: float
+    max_supply: float
+
 # Helper functions to use the CoinMarketCap API
 
+# Only a dashed quote is stripped, so USD-suffixed coins such as BUSD and TUSD keep their symbol
+_USD_SUFFIX = re.compile(r"(?<=.)-USD$", re.IGNORECASE)
+
+def _clean_symbol(symbol: str) -> str:
+    """Return the bare CoinMarketCap symbol for a ticker, e.g. "btc-usd" -> "BTC" (BUSD stays BUSD)"""
+    return _USD_SUFFIX.sub("", symbol).upper()
+
+@functools.lru_cache(maxsize=1)
+def _get_api() -> CoinMarketCapAPI:
+    """Return the client shared by the helpers below, so they reuse one session and its connections"""
+    return CoinMarketCapAPI()
+
+def _to_cmc_quote(symbol: str, data: Dict) -> Optional[CmcQuote]:
+    """Build a CmcQuote from one symbol's quotes data, or None if it has no USD quote"""
+    usd = data.get("quote", {}).get("USD")
+    if not usd:
+        return None
+    
+    return CmcQuote(
+        symbol=symbol,
+        price=usd.get("price") or 0,
+        market_cap=usd.get("market_cap") or 0,
+        volume_24h=usd.get("volume_24h") or 0,
+        percent_change_24h=usd.get("percent_change_24h") or 0,
+        percent_change_7d=usd.get("percent_change_7d") or 0,
+        percent_change_30d=usd.get("percent_change_30d") or 0,
+        market_cap_dominance=usd.get("market_cap_dominance") or 0,
+        circulating_supply=data.get("circulating_supply") or 0,
+        max_supply=data.get("max_supply") or 0,
+    )
+
+def get_cmc_quotes(symbols: List[str]) -> Dict[str, CmcQuote]:
+    """
+    Get the latest USD quotes for several cryptocurrencies from a single batched quotes request
+    
+    Parameters:
+    - symbols: List of cryptocurrency symbols (e.g., ["BTC", "ETH"])
+    
+    Returns:
+    - Dictionary mapping each cleaned symbol with a USD quote to its CmcQuote (missing values as 0)
+    """
+    api = _get_api()
+    symbols = list(map(_clean_symbol, symbols))
+    
+    quotes = api.get_cryptocurrency_quotes(symbols)
+    if "error" in quotes:
+        return {}
+    
+    result = {}
+    for symbol, data in quotes["data"].items():
+        quote = _to_cmc_quote(symbol, data)
+        if quote is not None:
+            result[symbol] = quote
+    return result
+
+def get_cmc_quote(symbol: str) -> Optional[CmcQuote]:
+    """
+    Get the latest USD quote for a cryptocurrency as a CmcQuote, or None if no USD quote is available
+    
+    Parameters:
+    - symbol: Cryptocurrency symbol (e.g., "BTC", "ETH")
+    """
+    return get_cmc_quotes([symbol]).get(_clean_symbol(symbol))
+
 def get_cmc_crypto_data(symbol: str) -> Dict:
     """
     Get comprehensive data for a cryptocurrency from CoinMarketCap
@@ -239,22 +428,19 @@ def get_cmc_crypto_data(symbol: str) -> Dict:
     Returns:
     - Dictionary containing comprehensive cryptocurrency data
     """
-    api = CoinMarketCapAPI()
+    api = _get_api()
     
     # Clean up symbol format
-    symbol = symbol.upper().replace("-USD", "").replace("USD", "")
-    
-    # Get metadata
-    info = api.get_cryptocurrency_info(symbol)
+    symbol = _clean_symbol(symbol)
     
-    # Get latest quotes
-    quotes = api.get_cryptocurrency_quotes(symbol)
-    
-    # Get market pairs data
-    market_pairs = api.get_cryptocurrency_market_pairs(symbol)
-    
-    # Get historical OHLCV data
+    # Get metadata, latest quotes, market pairs and historical OHLCV data concurrently
+    info_future = _REQUEST_POOL.submit(api.get_cryptocurrency_info, symbol)
+    quotes_future = _REQUEST_POOL.submit(api.get_cryptocurrency_quotes, symbol)
+    market_pairs_future = _REQUEST_POOL.submit(api.get_cryptocurrency_market_pairs, symbol)
     ohlcv = api.get_cryptocurrency_ohlcv(symbol)
+    info = info_future.result()
+    quotes = quotes_future.result()
+    market_pairs = market_pairs_future.result()
     
     # Compile all data
     result = {
@@ -275,13 +461,12 @@ def get_cmc_crypto_market_overview() -> Dict:
     Returns:
     - Dictionary containing market overview data
     """
-    api = CoinMarketCapAPI()
+    api = _get_api()
     
-    # Get global metrics
-    global_metrics = api.get_global_metrics()
-    
-    # Get top 20 cryptocurrencies
+    # Get global metrics and the top 20 cryptocurrencies concurrently
+    global_metrics_future = _REQUEST_POOL.submit(api.get_global_metrics)
     top_cryptos = api.get_latest_listings(limit=20)
+    global_metrics = global_metrics_future.result()
     
     return {
         "timestamp": datetime.now().isoformat(),
@@ -299,10 +484,10 @@ def get_cmc_crypto_analysis(symbol: str) -> Dict:
     Returns:
     - Dictionary containing analyzed cryptocurrency data
     """
-    api = CoinMarketCapAPI()
+    api = _get_api()
     
     # Clean up symbol format
-    symbol = symbol.upper().replace("-USD", "").replace("USD", "")
+    symbol = _clean_symbol(symbol)
     
     # Get cryptocurrency quotes data
     quotes = api.get_cryptocurrency_quotes(symbol)
@@ -381,6 +566,15 @@ def get_cmc_crypto_analysis(symbol: str) -> Dict:
     
     return result
 
+# Comparison output field and the USD quote metric it reports
+COMPARISON_FIELDS = (
+    ("price_usd", "price"),
+    ("market_cap_usd", "market_cap"),
+    ("volume_24h_usd", "volume_24h"),
+    ("percent_change_24h", "percent_change_24h"),
+    ("percent_change_7d", "percent_change_7d"),
+)
+
 def compare_cmc_cryptocurrencies(symbols: List[str]) -> Dict:
     """
     Compare multiple cryptocurrencies using CoinMarketCap data
@@ -391,52 +585,66 @@ def compare_cmc_cryptocurrencies(symbols: List[str]) -> Dict:
     Returns:
     - Dictionary containing comparison data
     """
-    api = CoinMarketCapAPI()
+    api = _get_api()
     
     # Clean up symbols
-    symbols = [symbol.upper().replace("-USD", "").replace("USD", "") for symbol in symbols]
-    
-    # Get quotes for all symbols
-    symbol_string = ",".join(symbols)
-    url = f"{CMC_API_BASE_URL}/cryptocurrency/quotes/latest"
-    params = {
-        "symbol": symbol_string,
-        "convert": "USD"
-    }
+    symbols = list(map(_clean_symbol, symbols))
     
-    try:
-        response = api.session.get(url, params=params)
-        response.raise_for_status()
-        data = response.json()
-        
-        if "data" not in data:
-            return {"error": "No data returned from CoinMarketCap API"}
-        
-        # Process each cryptocurrency's data
-        comparison = {}
-        for symbol in symbols:
-            if symbol in data["data"]:
-                crypto_data = data["data"][symbol]
-                quote_data = crypto_data.get("quote", {}).get("USD", {})
-                
-                comparison[symbol] = {
-                    "name": crypto_data.get("name", "Unknown"),
-                    "price_usd": quote_data.get("price", 0),
-                    "market_cap_usd": quote_data.get("market_cap", 0),
-                    "volume_24h_usd": quote_data.get("volume_24h", 0),
-                    "percent_change_24h": quote_data.get("percent_change_24h", 0),
-                    "percent_change_7d": quote_data.get("percent_change_7d", 0)
-                }
-            else:
-                comparison[symbol] = {"error": f"No data found for {symbol}"}
-        
-        return {
-            "timestamp": datetime.now().isoformat(),
-            "comparison_data": comparison
-        }
-        
-    except requests.exceptions.RequestException as e:
-        return {"error": f"Error comparing cryptocurrencies: {str(e)}"}
+    # Get quotes for all symbols in one batched request
+    quotes = api.get_cryptocurrency_quotes(symbols)
+    if "error" in quotes:
+        return quotes
+    
+    # Process each cryptocurrency's data
+    comparison = {}
+    for symbol in symbols:
+        crypto_data = quotes["data"].get(symbol)
+        if crypto_data is None:
+            comparison[symbol] = {"error": f"No data found for {symbol}"}
+            continue
+        quote_data = crypto_data.get("quote", {}).get("USD") or {}
+        comparison[symbol] = {"name": crypto_data.get("name", "Unknown")}
+        comparison[symbol].update((field, quote_data.get(metric, 0)) for field, metric in COMPARISON_FIELDS)
+    
+    return {
+        "timestamp": datetime.now().isoformat(),
+        "comparison_data": comparison
+    }
+
+# USD quote fields read by the investment recommendation, in unpacking order
+RECOMMENDATION_METRICS = ("price", "market_cap", "volume_24h", "percent_change_1h", "percent_change_24h",
+                          "percent_change_7d", "percent_change_30d")
+
+# Technical score contribution of each price-change window: the first (threshold, points) rung the change
+# exceeds among the gains, otherwise the first rung it falls below among the losses
+MOMENTUM_SCORE_TABLE = (
+    ("percent_change_1h", ((1, 1),), ((-1, -1),)),
+    ("percent_change_24h", ((5, 2), (2, 1)), ((-5, -2), (-2, -1))),
+    ("percent_change_7d", ((10, 2), (5, 1)), ((-10, -2), (-5, -1))),
+    ("percent_change_30d", ((20, 2), (10, 1)), ((-20, -2), (-10, -1))),
+    ("percent_change_60d", ((50, 1),), ((-50, -1),)),
+    ("percent_change_90d", ((100, 1),), ((-50, -1),)),
+)
+
+# Recommendation ladder per risk tolerance: (score thresholds, rungs). A score lands on rung
+# bisect_right(thresholds, score); each rung is (recommendation, confidence, market cap profile it requires)
+RECOMMENDATION_LADDERS = {
+    "low": (
+        (-5, -3, -1, 2, 4, 6),
+        (("Strong Sell", 85, None), ("Sell", 65, None), ("Mild Sell", 55, None), ("Hold", 60, None),
+         ("Mild Buy", 55, "moderate"), ("Buy", 70, "low"), ("Strong Buy", 90, "low")),
+    ),
+    "moderate": (
+        (-4, -2, 0, 1, 3, 5),
+        (("Strong Sell", 80, None), ("Sell", 65, None), ("Mild Sell", 55, None), ("Hold", 60, None),
+         ("Mild Buy", 55, None), ("Buy", 70, None), ("Strong Buy", 85, None)),
+    ),
+    "high": (
+        (-3, -1, 0, 1, 2, 4),
+        (("Strong Sell", 75, None), ("Sell", 60, None), ("Mild Sell", 55, None), ("Hold", 60, None),
+         ("Mild Buy", 55, None), ("Buy", 65, None), ("Strong Buy", 80, None)),
+    ),
+}
 
 def get_cmc_investment_recommendation(symbol: str, risk_tolerance: str = "moderate") -> Dict:
     """
@@ -449,34 +657,29 @@ def get_cmc_investment_recommendation(symbol: str, risk_tolerance: str = "modera
     Returns:
     - Dictionary containing detailed investment recommendation
     """
-    api = CoinMarketCapAPI()
+    api = _get_api()
     
     # Clean up symbol format
-    symbol = symbol.upper().replace("-USD", "").replace("USD", "")
+    symbol = _clean_symbol(symbol)
     
-    # Get cryptocurrency quotes data
+    # Get cryptocurrency quotes data, with the info request for additional data in flight alongside it
+    info_future = _REQUEST_POOL.submit(api.get_cryptocurrency_info, symbol)
     quotes = api.get_cryptocurrency_quotes(symbol)
     
     if "error" in quotes:
         return quotes
     
-    # Get cryptocurrency info for additional data
-    info = api.get_cryptocurrency_info(symbol)
+    info = info_future.result()
     
     # Extract quote data
     crypto_data = quotes.get("data", {})
-    quote_data = crypto_data.get("quote", {}).get("USD", {})
+    quote_data = crypto_data.get("quote", {}).get("USD") or {}
     
-    # Extract key metrics
-    price = quote_data.get("price", 0)
-    market_cap = quote_data.get("market_cap", 0)
-    volume_24h = quote_data.get("volume_24h", 0)
-    percent_change_1h = quote_data.get("percent_change_1h", 0)
-    percent_change_24h = quote_data.get("percent_change_24h", 0)
-    percent_change_7d = quote_data.get("percent_change_7d", 0)
-    percent_change_30d = quote_data.get("percent_change_30d", 0)
-    percent_change_60d = quote_data.get("percent_change_60d", 0) if "percent_change_60d" in quote_data else None
-    percent_change_90d = quote_data.get("percent_change_90d", 0) if "percent_change_90d" in quote_data else None
+    # Extract key metrics in one pass over the USD quote
+    (price, market_cap, volume_24h, percent_change_1h, percent_change_24h,
+     percent_change_7d, percent_change_30d) = [quote_data.get(metric, 0) for metric in RECOMMENDATION_METRICS]
+    percent_change_60d = quote_data.get("percent_change_60d")
+    percent_change_90d = quote_data.get("percent_change_90d")
     
     # Calculate volume to market cap ratio (liquidity indicator)
     volume_to_mcap_ratio = volume_24h / market_cap if market_cap > 0 else 0
@@ -495,52 +698,20 @@ def get_cmc_investment_recommendation(symbol: str, risk_tolerance: str = "modera
     # Calculate technical scores
     technical_score = 0
     
-    # Short-term momentum (1h, 24h)
-    if percent_change_1h > 1:
-        technical_score += 1
-    elif percent_change_1h < -1:
-        technical_score -= 1
-        
-    if percent_change_24h > 5:
-        technical_score += 2
-    elif percent_change_24h > 2:
-        technical_score += 1
-    elif percent_change_24h < -5:
-        technical_score -= 2
-    elif percent_change_24h < -2:
-        technical_score -= 1
-    
-    # Medium-term momentum (7d, 30d)
-    if percent_change_7d > 10:
-        technical_score += 2
-    elif percent_change_7d > 5:
-        technical_score += 1
-    elif percent_change_7d < -10:
-        technical_score -= 2
-    elif percent_change_7d < -5:
-        technical_score -= 1
-        
-    if percent_change_30d > 20:
-        technical_score += 2
-    elif percent_change_30d > 10:
-        technical_score += 1
-    elif percent_change_30d < -20:
-        technical_score -= 2
-    elif percent_change_30d < -10:
-        technical_score -= 1
-    
-    # Longer-term trends if available
-    if percent_change_60d is not None:
-        if percent_change_60d > 50:
-            technical_score += 1
-        elif percent_change_60d < -50:
-            technical_score -= 1
-            
-    if percent_change_90d is not None:
-        if percent_change_90d > 100:
-            technical_score += 1
-        elif percent_change_90d < -50:
-            technical_score -= 1
+    # Momentum over short (1h, 24h), medium (7d, 30d) and, when available, longer-term (60d, 90d) windows
+    for metric, gains, losses in MOMENTUM_SCORE_TABLE:
+        change = quote_data.get(metric)
+        if change is None:
+            continue
+        for threshold, points in gains:
+            if change > threshold:
+                technical_score += points
+                break
+        else:
+            for threshold, points in losses:
+                if change < threshold:
+                    technical_score += points
+                    break
     
     # Liquidity bonus for highly liquid assets
     if volume_to_mcap_ratio > 0.1:  # Over 10% of market cap traded daily
@@ -554,78 +725,13 @@ def get_cmc_investment_recommendation(symbol: str, risk_tolerance: str = "modera
     elif market_dominance > 15:  # ETH-like dominance
         technical_score += 1
     
-    # Determine recommendation based on technical score and risk tolerance
-    recommendation = ""
-    confidence_score = 0
-    
-    if risk_tolerance == "low":
-        if technical_score >= 6 and risk_profiles["low"]:
-            recommendation = "Strong Buy"
-            confidence_score = 90
-        elif technical_score >= 4 and risk_profiles["low"]:
-            recommendation = "Buy"
-            confidence_score = 70
-        elif technical_score <= -6:
-            recommendation = "Strong Sell"
-            confidence_score = 85
-        elif technical_score <= -4:
-            recommendation = "Sell"
-            confidence_score = 65
-        elif technical_score >= 2 and risk_profiles["moderate"]:
-            recommendation = "Mild Buy"
-            confidence_score = 55
-        elif technical_score <= -2:
-            recommendation = "Mild Sell"
-            confidence_score = 55
-        else:
-            recommendation = "Hold"
-            confidence_score = 60
-            
-    elif risk_tolerance == "moderate":
-        if technical_score >= 5:
-            recommendation = "Strong Buy"
-            confidence_score = 85
-        elif technical_score >= 3:
-            recommendation = "Buy"
-            confidence_score = 70
-        elif technical_score <= -5:
-            recommendation = "Strong Sell"
-            confidence_score = 80
-        elif technical_score <= -3:
-            recommendation = "Sell"
-            confidence_score = 65
-        elif technical_score >= 1:
-            recommendation = "Mild Buy"
-            confidence_score = 55
-        elif technical_score <= -1:
-            recommendation = "Mild Sell"
-            confidence_score = 55
-        else:
-            recommendation = "Hold"
-            confidence_score = 60
-            
-    else:  # high risk tolerance
-        if technical_score >= 4:
-            recommendation = "Strong Buy"
-            confidence_score = 80
-        elif technical_score >= 2:
-            recommendation = "Buy"
-            confidence_score = 65
-        elif technical_score <= -4:
-            recommendation = "Strong Sell"
-            confidence_score = 75
-        elif technical_score <= -2:
-            recommendation = "Sell"
-            confidence_score = 60
-        elif technical_score >= 1:
-            recommendation = "Mild Buy"
-            confidence_score = 55
-        elif technical_score <= -1:
-            recommendation = "Mild Sell"
-            confidence_score = 55
-        else:
-            recommendation = "Hold"
-            confidence_score = 60
+    # Determine recommendation based on technical score and risk tolerance: locate the score's rung, then step
+    # down past rungs whose market cap requirement the asset doesn't meet
+    thresholds, rungs = RECOMMENDATION_LADDERS.get(risk_tolerance, RECOMMENDATION_LADDERS["high"])
+    rung = bisect_right(thresholds, technical_score)
+    while rungs[rung][2] is not None and not risk_profiles[rungs[rung][2]]:
+        rung -= 1
+    recommendation, confidence_score, _ = rungs[rung]
     
     # Calculate risk level
     if risk_profiles["low"]:
@@ -660,89 +766,88 @@ def get_cmc_investment_recommendation(symbol: str, risk_tolerance: str = "modera
             # Even with positive technical score, some downside is possible
             potential_downside = round(volatility_factor * 15, 2)  # Reduced downside projection
     
-    # Generate investment thesis based on recommendation
-    investment_thesis = ""
-    risks = ""
+    # Generate investment thesis based on recommendation; sentences are collected and joined once
+    name = crypto_data.get("name", symbol)
+    thesis = []
     
     if "Buy" in recommendation:
-        investment_thesis = f"{crypto_data.get('name', symbol)} shows {percent_change_7d:.2f}% growth over the past week"
+        thesis.append(f"{name} shows {percent_change_7d:.2f}% growth over the past week")
         
         if percent_change_24h > 0:
-            investment_thesis += f" and {percent_change_24h:.2f}% in the last 24 hours"
+            thesis.append(f" and {percent_change_24h:.2f}% in the last 24 hours")
             
         if percent_change_30d > 0:
-            investment_thesis += f", with sustained momentum of {percent_change_30d:.2f}% over the past month"
+            thesis.append(f", with sustained momentum of {percent_change_30d:.2f}% over the past month")
         
-        investment_thesis += ". "
+        thesis.append(". ")
         
         if volume_to_mcap_ratio > 0.05:
-            investment_thesis += f"Strong trading volume at {volume_24h/1000000:.2f}M USD represents good liquidity. "
+            thesis.append(f"Strong trading volume at {volume_24h/1000000:.2f}M USD represents good liquidity. ")
             
         if market_dominance and market_dominance > 1:
-            investment_thesis += f"Market dominance of {market_dominance:.2f}% shows significant market presence. "
+            thesis.append(f"Market dominance of {market_dominance:.2f}% shows significant market presence. ")
             
         # Add info from CoinMarketCap if available
         if "error" not in info:
             tags = info.get("data", {}).get("tags", [])
             if tags and len(tags) > 0:
-                investment_thesis += f"Tagged as {', '.join(tags[:3])} on CoinMarketCap. "
+                thesis.append(f"Tagged as {', '.join(tags[:3])} on CoinMarketCap. ")
     
     elif "Sell" in recommendation:
-        investment_thesis = f"{crypto_data.get('name', symbol)} shows "
+        thesis.append(f"{name} shows ")
         
         if percent_change_7d < 0:
-            investment_thesis += f"{percent_change_7d:.2f}% decline over the past week"
+            thesis.append(f"{percent_change_7d:.2f}% decline over the past week")
             
         if percent_change_24h < 0:
-            if "decline" in investment_thesis:
-                investment_thesis += f" and {percent_change_24h:.2f}% in the last 24 hours"
+            if percent_change_7d < 0:
+                thesis.append(f" and {percent_change_24h:.2f}% in the last 24 hours")
             else:
-                investment_thesis += f"{percent_change_24h:.2f}% decline in the last 24 hours"
+                thesis.append(f"{percent_change_24h:.2f}% decline in the last 24 hours")
                 
         if percent_change_30d < 0:
-            investment_thesis += f", with a significant downtrend of {percent_change_30d:.2f}% over the past month"
+            thesis.append(f", with a significant downtrend of {percent_change_30d:.2f}% over the past month")
         
-        investment_thesis += ". "
+        thesis.append(". ")
         
         if volume_to_mcap_ratio < 0.01:
-            investment_thesis += "Low trading volume relative to market cap may indicate reduced interest. "
+            thesis.append("Low trading volume relative to market cap may indicate reduced interest. ")
     
     else:  # Hold
-        investment_thesis = f"{crypto_data.get('name', symbol)} is showing mixed signals with "
+        thesis.append(f"{name} is showing mixed signals with ")
         
         if percent_change_24h > 0:
-            investment_thesis += f"{percent_change_24h:.2f}% growth in the last 24 hours"
+            thesis.append(f"{percent_change_24h:.2f}% growth in the last 24 hours")
         else:
-            investment_thesis += f"{percent_change_24h:.2f}% change in the last 24 hours"
+            thesis.append(f"{percent_change_24h:.2f}% change in the last 24 hours")
             
-        if percent_change_7d > 0:
-            investment_thesis += f" and {percent_change_7d:.2f}% over the past week"
-        else:
-            investment_thesis += f" and {percent_change_7d:.2f}% over the past week"
+        thesis.append(f" and {percent_change_7d:.2f}% over the past week")
         
-        investment_thesis += ". Current technical indicators don't show a strong directional bias. "
+        thesis.append(". Current technical indicators don't show a strong directional bias. ")
+    
+    investment_thesis = "".join(thesis)
     
     # Generate risk assessment
     if risk_profiles["low"]:
-        risks = f"As one of the larger cryptocurrencies with a market cap of ${market_cap/1000000000:.2f}B, {crypto_data.get('name', symbol)} has relatively lower risk compared to smaller altcoins. "
+        risks = [f"As one of the larger cryptocurrencies with a market cap of ${market_cap/1000000000:.2f}B, {name} has relatively lower risk compared to smaller altcoins. "]
     elif risk_profiles["moderate"]:
-        risks = f"With a market cap of ${market_cap/1000000000:.2f}B, {crypto_data.get('name', symbol)} has moderate volatility and risk exposure. "
+        risks = [f"With a market cap of ${market_cap/1000000000:.2f}B, {name} has moderate volatility and risk exposure. "]
     elif risk_profiles["high"]:
-        risks = f"{crypto_data.get('name', symbol)} has a market cap of ${market_cap/1000000000:.2f}B, which exposes it to higher volatility and risk than larger cryptocurrencies. "
+        risks = [f"{name} has a market cap of ${market_cap/1000000000:.2f}B, which exposes it to higher volatility and risk than larger cryptocurrencies. "]
     else:
-        risks = f"With a smaller market cap of ${market_cap/1000000:.2f}M, {crypto_data.get('name', symbol)} is subject to high volatility and significant risk. "
+        risks = [f"With a smaller market cap of ${market_cap/1000000:.2f}M, {name} is subject to high volatility and significant risk. "]
     
-    risks += f"Daily trading volume of ${volume_24h/1000000:.2f}M "
+    risks.append(f"Daily trading volume of ${volume_24h/1000000:.2f}M ")
     
     if volume_to_mcap_ratio > 0.1:
-        risks += "indicates strong liquidity, which can help mitigate some execution risks. "
+        risks.append("indicates strong liquidity, which can help mitigate some execution risks. ")
     elif volume_to_mcap_ratio > 0.05:
-        risks += "indicates adequate liquidity for moderate position sizes. "
+        risks.append("indicates adequate liquidity for moderate position sizes. ")
     else:
-        risks += "indicates potential liquidity constraints, which could amplify volatility. "
+        risks.append("indicates potential liquidity constraints, which could amplify volatility. ")
     
     if percent_change_30d > 30 or percent_change_30d < -30:
-        risks += f"Recent 30-day volatility of {abs(percent_change_30d):.2f}% suggests significant price swings may continue. "
+        risks.append(f"Recent 30-day volatility of {abs(percent_change_30d):.2f}% suggests significant price swings may continue. ")
     
     # Compile the final recommendation
     result = {
@@ -774,7 +879,7 @@ def get_cmc_investment_recommendation(symbol: str, risk_tolerance: str = "modera
         "potential_upside": potential_upside,
         "potential_downside": potential_downside,
         "investment_thesis": investment_thesis,
-        "risks": risks,
+        "risks": "".join(risks),
         "timestamp": datetime.now().isoformat(),
         "disclaimer": "This analysis is for informational purposes only and should not be considered financial advice. Always conduct your own research and consider consulting with a financial advisor before making investment decisions. Cryptocurrency investments are especially high-risk and speculative."
     }
@@ -47,6 +47,110 @@ def calculate_bollinger_bands(data, window=20, num_std=2):
         'lower_band': lower_band
     }
 
+def latest_technical_indicators(close):
+    """
+    Summarize moving-average, RSI, MACD and Bollinger Band readings for the latest bar
+    
+    The indicator series come from the vectorized pandas kernels above; only their last two
+    rows are pulled into a NumPy array, once, so the signal rules run on plain floats.
+    
+    Parameters:
+    - close: Series of closing prices
+    
+    Returns:
+    - Dictionary in the "technical_indicators" layout used by the analysis functions
+    """
+    macd_data = calculate_macd(close)
+    bb_data = calculate_bollinger_bands(close)
+    series = [
+        close,
+        calculate_moving_average(close, 50),
+        calculate_moving_average(close, 200),
+        calculate_rsi(close),
+        macd_data['macd_line'],
+        macd_data['signal_line'],
+        bb_data['upper_band'],
+        bb_data['middle_band'],
+        bb_data['lower_band']
+    ]
+    tail = np.column_stack([s.to_numpy(dtype=float)[-2:] for s in series])
+    if tail.shape[0] < 2:
+        tail = np.vstack([np.full(tail.shape[1], np.nan), tail])
+    
+    previous, latest = tail.tolist()
+    price, ma50, ma200, rsi, macd, macd_sig, bb_upper, bb_middle, bb_lower = latest
+    _, prev_ma50, prev_ma200, _, prev_macd, prev_macd_sig, _, _, _ = previous
+    
+    def value(x):
+        return None if np.isnan(x) else x
+    
+    golden_cross = False
+    death_cross = False
+    if not np.isnan([ma50, ma200, prev_ma50, prev_ma200]).any():
+        golden_cross = prev_ma50 <= prev_ma200 and ma50 > ma200
+        death_cross = prev_ma50 >= prev_ma200 and ma50 < ma200
+    
+    rsi_signal = ""
+    if not np.isnan(rsi):
+        if rsi < 30:
+            rsi_signal = "Oversold"
+        elif rsi > 70:
+            rsi_signal = "Overbought"
+        else:
+            rsi_signal = "Neutral"
+    
+    # MACD signal
+    macd_signal = ""
+    if not np.isnan([macd, macd_sig, prev_macd, prev_macd_sig]).any():
+        if prev_macd <= prev_macd_sig and macd > macd_sig:
+            macd_signal = "Bullish Crossover"
+        elif prev_macd >= prev_macd_sig and macd < macd_sig:
+            macd_signal = "Bearish Crossover"
+        elif macd > macd_sig:
+            macd_signal = "Bullish"
+        else:
+            macd_signal = "Bearish"
+    
+    # Bollinger Bands signal
+    bb_signal = ""
+    if not np.isnan([bb_upper, bb_lower]).any():
+        if price > bb_upper:
+            bb_signal = "Overbought"
+        elif price < bb_lower:
+            bb_signal = "Oversold"
+        else:
+            bb_signal = "Within Bands"
+    
+    def position(average):
+        if np.isnan(average):
+            return "Unknown"
+        return "Above" if price > average else "Below"
+    
+    return {
+        "moving_averages": {
+            "ma50": value(ma50),
+            "ma200": value(ma200),
+            "golden_cross": golden_cross,
+            "death_cross": death_cross,
+            "price_vs_ma50": position(ma50),
+            "price_vs_ma200": position(ma200)
+        },
+        "rsi": {
+            "current": value(rsi),
+            "signal": rsi_signal
+        },
+        "macd": {
+            "current": value(macd),
+            "signal": macd_signal
+        },
+        "bollinger_bands": {
+            "upper": value(bb_upper),
+            "middle": value(bb_middle),
+            "lower": value(bb_lower),
+            "signal": bb_signal
+        }
+    }
+
 def get_company_financials(ticker):
     """Get key financial statements and ratios for a company"""
     try:
@@ -191,18 +295,7 @@ def extract_financial_insights(ticker, period="1y"):
         company_name = info.get('longName', ticker)
         
         # Calculate technical indicators
-        data['MA50'] = calculate_moving_average(data['Close'], 50)
-        data['MA200'] = calculate_moving_average(data['Close'], 200)
-        data['RSI'] = calculate_rsi(data['Close'])
-        
-        macd_data = calculate_macd(data['Close'])
-        data['MACD'] = macd_data['macd_line']
-        data['MACD_Signal'] = macd_data['signal_line']
-        
-        bb_data = calculate_bollinger_bands(data['Close'])
-        data['BB_Upper'] = bb_data['upper_band']
-        data['BB_Middle'] = bb_data['middle_band']
-        data['BB_Lower'] = bb_data['lower_band']
+        technical_indicators = latest_technical_indicators(data['Close'])
         
         # Get fundamental data
         financials = get_company_financials(ticker)
@@ -215,49 +308,6 @@ def extract_financial_insights(ticker, period="1y"):
         price_change_1d = ((data['Close'].iloc[-1] - data['Close'].iloc[-2]) / data['Close'].iloc[-2]) * 100 if len(data) > 1 else None
         price_change_period = ((data['Close'].iloc[-1] - data['Close'].iloc[0]) / data['Close'].iloc[0]) * 100
         
-        # Technical signals
-        ma50_latest = data['MA50'].iloc[-1] if not pd.isna(data['MA50'].iloc[-1]) else None
-        ma200_latest = data['MA200'].iloc[-1] if not pd.isna(data['MA200'].iloc[-1]) else None
-        
-        golden_cross = False
-        death_cross = False
-        
-        if not pd.isna(data['MA50'].iloc[-1]) and not pd.isna(data['MA200'].iloc[-1]) and not pd.isna(data['MA50'].iloc[-2]) and not pd.isna(data['MA200'].iloc[-2]):
-            golden_cross = data['MA50'].iloc[-2] <= data['MA200'].iloc[-2] and data['MA50'].iloc[-1] > data['MA200'].iloc[-1]
-            death_cross = data['MA50'].iloc[-2] >= data['MA200'].iloc[-2] and data['MA50'].iloc[-1] < data['MA200'].iloc[-1]
-        
-        rsi_latest = data['RSI'].iloc[-1] if not pd.isna(data['RSI'].iloc[-1]) else None
-        rsi_signal = ""
-        if rsi_latest is not None:
-            if rsi_latest < 30:
-                rsi_signal = "Oversold"
-            elif rsi_latest > 70:
-                rsi_signal = "Overbought"
-            else:
-                rsi_signal = "Neutral"
-        
-        # MACD signal
-        macd_signal = ""
-        if not pd.isna(data['MACD'].iloc[-1]) and not pd.isna(data['MACD_Signal'].iloc[-1]) and not pd.isna(data['MACD'].iloc[-2]) and not pd.isna(data['MACD_Signal'].iloc[-2]):
-            if data['MACD'].iloc[-2] <= data['MACD_Signal'].iloc[-2] and data['MACD'].iloc[-1] > data['MACD_Signal'].iloc[-1]:
-                macd_signal = "Bullish Crossover"
-            elif data['MACD'].iloc[-2] >= data['MACD_Signal'].iloc[-2] and data['MACD'].iloc[-1] < data['MACD_Signal'].iloc[-1]:
-                macd_signal = "Bearish Crossover"
-            elif data['MACD'].iloc[-1] > data['MACD_Signal'].iloc[-1]:
-                macd_signal = "Bullish"
-            else:
-                macd_signal = "Bearish"
-        
-        # Bollinger Bands signal
-        bb_signal = ""
-        if not pd.isna(data['BB_Upper'].iloc[-1]) and not pd.isna(data['BB_Lower'].iloc[-1]):
-            if data['Close'].iloc[-1] > data['BB_Upper'].iloc[-1]:
-                bb_signal = "Overbought"
-            elif data['Close'].iloc[-1] < data['BB_Lower'].iloc[-1]:
-                bb_signal = "Oversold"
-            else:
-                bb_signal = "Within Bands"
-        
         # Compile the analysis
         analysis = {
             "ticker": ticker,
@@ -269,30 +319,7 @@ def extract_financial_insights(ticker, period="1y"):
                 "period_change_pct": price_change_period,
                 "period_analyzed": period
             },
-            "technical_indicators": {
-                "moving_averages": {
-                    "ma50": ma50_latest,
-                    "ma200": ma200_latest,
-                    "golden_cross": golden_cross,
-                    "death_cross": death_cross,
-                    "price_vs_ma50": "Above" if current_price > ma50_latest else "Below" if ma50_latest is not None else "Unknown",
-                    "price_vs_ma200": "Above" if current_price > ma200_latest else "Below" if ma200_latest is not None else "Unknown"
-                },
-                "rsi": {
-                    "current": rsi_latest,
-                    "signal": rsi_signal
-                },
-                "macd": {
-                    "current": data['MACD'].iloc[-1] if not pd.isna(data['MACD'].iloc[-1]) else None,
-                    "signal": macd_signal
-                },
-                "bollinger_bands": {
-                    "upper": data['BB_Upper'].iloc[-1] if not pd.isna(data['BB_Upper'].iloc[-1]) else None,
-                    "middle": data['BB_Middle'].iloc[-1] if not pd.isna(data['BB_Middle'].iloc[-1]) else None,
-                    "lower": data['BB_Lower'].iloc[-1] if not pd.isna(data['BB_Lower'].iloc[-1]) else None,
-                    "signal": bb_signal
-                }
-            },
+            "technical_indicators": technical_indicators,
             "fundamentals": financials,
             "analyst_recommendations": analyst_data
         }
@@ -866,67 +893,13 @@ def analyze_crypto(symbol, period="1y"):
         name = ticker_info.get('name', symbol.split('-')[0])
         
         # Calculate technical indicators
-        data['MA50'] = calculate_moving_average(data['Close'], 50)
-        data['MA200'] = calculate_moving_average(data['Close'], 200)
-        data['RSI'] = calculate_rsi(data['Close'])
-        
-        macd_data = calculate_macd(data['Close'])
-        data['MACD'] = macd_data['macd_line']
-        data['MACD_Signal'] = macd_data['signal_line']
-        
-        bb_data = calculate_bollinger_bands(data['Close'])
-        data['BB_Upper'] = bb_data['upper_band']
-        data['BB_Middle'] = bb_data['middle_band']
-        data['BB_Lower'] = bb_data['lower_band']
+        technical_indicators = latest_technical_indicators(data['Close'])
         
         # Current price data
         current_price = data['Close'].iloc[-1]
         price_change_1d = ((data['Close'].iloc[-1] - data['Close'].iloc[-2]) / data['Close'].iloc[-2]) * 100 if len(data) > 1 else None
         price_change_period = ((data['Close'].iloc[-1] - data['Close'].iloc[0]) / data['Close'].iloc[0]) * 100
         
-        # Technical signals
-        ma50_latest = data['MA50'].iloc[-1] if not pd.isna(data['MA50'].iloc[-1]) else None
-        ma200_latest = data['MA200'].iloc[-1] if not pd.isna(data['MA200'].iloc[-1]) else None
-        
-        golden_cross = False
-        death_cross = False
-        
-        if not pd.isna(data['MA50'].iloc[-1]) and not pd.isna(data['MA200'].iloc[-1]) and not pd.isna(data['MA50'].iloc[-2]) and not pd.isna(data['MA200'].iloc[-2]):
-            golden_cross = data['MA50'].iloc[-2] <= data['MA200'].iloc[-2] and data['MA50'].iloc[-1] > data['MA200'].iloc[-1]
-            death_cross = data['MA50'].iloc[-2] >= data['MA200'].iloc[-2] and data['MA50'].iloc[-1] < data['MA200'].iloc[-1]
-        
-        rsi_latest = data['RSI'].iloc[-1] if not pd.isna(data['RSI'].iloc[-1]) else None
-        rsi_signal = ""
-        if rsi_latest is not None:
-            if rsi_latest < 30:
-                rsi_signal = "Oversold"
-            elif rsi_latest > 70:
-                rsi_signal = "Overbought"
-            else:
-                rsi_signal = "Neutral"
-        
-        # MACD signal
-        macd_signal = ""
-        if not pd.isna(data['MACD'].iloc[-1]) and not pd.isna(data['MACD_Signal'].iloc[-1]) and not pd.isna(data['MACD'].iloc[-2]) and not pd.isna(data['MACD_Signal'].iloc[-2]):
-            if data['MACD'].iloc[-2] <= data['MACD_Signal'].iloc[-2] and data['MACD'].iloc[-1] > data['MACD_Signal'].iloc[-1]:
-                macd_signal = "Bullish Crossover"
-            elif data['MACD'].iloc[-2] >= data['MACD_Signal'].iloc[-2] and data['MACD'].iloc[-1] < data['MACD_Signal'].iloc[-1]:
-                macd_signal = "Bearish Crossover"
-            elif data['MACD'].iloc[-1] > data['MACD_Signal'].iloc[-1]:
-                macd_signal = "Bullish"
-            else:
-                macd_signal = "Bearish"
-        
-        # Bollinger Bands signal
-        bb_signal = ""
-        if not pd.isna(data['BB_Upper'].iloc[-1]) and not pd.isna(data['BB_Lower'].iloc[-1]):
-            if data['Close'].iloc[-1] > data['BB_Upper'].iloc[-1]:
-                bb_signal = "Overbought"
-            elif data['Close'].iloc[-1] < data['BB_Lower'].iloc[-1]:
-                bb_signal = "Oversold"
-            else:
-                bb_signal = "Within Bands"
-        
         # Volume analysis
         avg_volume = data['Volume'].mean()
         recent_volume = data['Volume'].iloc[-5:].mean()
@@ -957,30 +930,7 @@ def analyze_crypto(symbol, period="1y"):
                 "recent_volume": recent_volume,
                 "volume_change_pct": volume_change
             },
-            "technical_indicators": {
-                "moving_averages": {
-                    "ma50": ma50_latest,
-                    "ma200": ma200_latest,
-                    "golden_cross": golden_cross,
-                    "death_cross": death_cross,
-                    "price_vs_ma50": "Above" if current_price > ma50_latest else "Below" if ma50_latest is not None else "Unknown",
-                    "price_vs_ma200": "Above" if current_price > ma200_latest else "Below" if ma200_latest is not None else "Unknown"
-                },
-                "rsi": {
-                    "current": rsi_latest,
-                    "signal": rsi_signal
-                },
-                "macd": {
-                    "current": data['MACD'].iloc[-1] if not pd.isna(data['MACD'].iloc[-1]) else None,
-                    "signal": macd_signal
-                },
-                "bollinger_bands": {
-                    "upper": data['BB_Upper'].iloc[-1] if not pd.isna(data['BB_Upper'].iloc[-1]) else None,
-                    "middle": data['BB_Middle'].iloc[-1] if not pd.isna(data['BB_Middle'].iloc[-1]) else None,
-                    "lower": data['BB_Lower'].iloc[-1] if not pd.isna(data['BB_Lower'].iloc[-1]) else None,
-                    "signal": bb_signal
-                }
-            }
+            "technical_indicators": technical_indicators
         }
         
         # Try to get additional crypto-specific metrics
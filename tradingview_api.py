@@ -1,9 +1,9 @@
 import os
+import functools
 import requests
 import json
 import time
 from datetime import datetime
-import pandas as pd
 from typing import Dict, List, Optional, Union, Any
 
 # TradingView API base URL
@@ -432,6 +432,11 @@ class TradingViewAPI:
 
 # Helper functions to use the TradingView API for cryptocurrency analysis
 
+@functools.lru_cache(maxsize=1)
+def _get_api() -> TradingViewAPI:
+    """Return the client shared by the helpers below, so they reuse one keep-alive connection pool"""
+    return TradingViewAPI()
+
 def get_tradingview_crypto_analysis(symbol: str, interval: str = "1d") -> Dict:
     """
     Get comprehensive technical analysis for a cryptocurrency from TradingView
@@ -443,7 +448,7 @@ def get_tradingview_crypto_analysis(symbol: str, interval: str = "1d") -> Dict:
     Returns:
     - Dictionary containing technical analysis indicators and interpreted signals
     """
-    api = TradingViewAPI()
+    api = _get_api()
     
     # Clean up the symbol format
     symbol = symbol.upper().replace("-USD", "").replace("USD", "")
@@ -488,7 +493,7 @@ def get_tradingview_crypto_market() -> Dict:
     Returns:
     - Dictionary containing market overview data
     """
-    api = TradingViewAPI()
+    api = _get_api()
     return api.get_crypto_market_summary()
 
 def get_tradingview_multi_timeframe_analysis(symbol: str) -> Dict:
@@ -501,7 +506,7 @@ def get_tradingview_multi_timeframe_analysis(symbol: str) -> Dict:
     Returns:
     - Dictionary containing multi-timeframe analysis
     """
-    api = TradingViewAPI()
+    api = _get_api()
     
     # Clean up symbol format
     symbol = symbol.upper().replace("-USD", "").replace("USD", "")